@@ -0,0 +1,184 @@
+import argparse
+import base64
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+TEXT_CASES = {
+    "static": ("ABBA", "SOS"),
+    "title_scrolls": ("Queen", "Bohemian Rhapsody (Remastered 2011)"),
+    "both_scroll": ("The Jimi Hendrix Experience", "All Along The Watchtower (Live At Woodstock)"),
+}
+
+
+def make_cover(path: Path, size: int) -> None:
+    rng = np.random.default_rng(size)
+    yy, xx = np.mgrid[0:size, 0:size]
+    base = np.stack(((xx * 255) // size, (yy * 255) // size, ((xx + yy) * 127) // size), axis=2)
+    noise = rng.integers(0, 40, (size, size, 3))
+    Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8), "RGB").save(path, quality=90)
+
+
+def case_config(canvas_size: int, pixoo_address: str) -> dict:
+    return {
+        "image": {
+            "canvas_size": canvas_size,
+            "cover_size": round(canvas_size * 46 / 64),
+            "display_mode": "stream",
+        },
+        "divoom": {
+            "ip": pixoo_address,
+            "auto_reset_gif_id": False,
+            "discovery": {"enabled": False},
+        },
+        "debug": {"logs": False, "preview_path": "", "pixoo_frame_path": "", "wav_path": ""},
+    }
+
+
+def run_case(cover_path: Path, cover_size: int, canvas_size: int, text_case: str, frames: int, repeats: int, mock) -> dict:
+    from vinylpi.web.services.config import write_config
+    from vinylpi.core import artwork, recognition
+    from vinylpi.core.cover_cache import load_cover
+    from vinylpi.core.render_cache import LAYERS
+    from vinylpi.integrations.divoom_api import PixooClient
+
+    write_config(case_config(canvas_size, mock.address))
+    recognition._pixoo_client = None
+    pixoo = recognition._get_pixoo()
+    artist, title = TEXT_CASES[text_case]
+
+    prepare_ms = []
+    for _ in range(repeats):
+        for lyr in LAYERS.values():
+            lyr.clear()
+        artwork._memo.clear()
+        start = time.perf_counter()
+        cover = load_cover(str(cover_path))
+        res = recognition._prepare_scroll_resources(cover, artist, title)
+        prepare_ms.append((time.perf_counter() - start) * 1000.0)
+
+    cycle = res["cycle"] or 1
+
+    render_s = 0.0
+    encode_s = 0.0
+    for i in range(20):
+        recognition._render_frame(res, i % cycle)
+
+    mock.reset_counters()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    for i in range(frames):
+        t0 = time.perf_counter()
+        frame = recognition._render_frame(res, i % cycle)
+        t1 = time.perf_counter()
+        base64.b64encode(PixooClient._image_to_rgb_bytes(frame))
+        t2 = time.perf_counter()
+        pixoo.send_frame(frame)
+        render_s += t1 - t0
+        encode_s += t2 - t1
+    cpu_s = time.thread_time() - cpu_start
+    wall_s = time.perf_counter() - wall_start
+
+    tracemalloc.start()
+    peaks = []
+    before = tracemalloc.take_snapshot()
+    for i in range(min(frames, 200)):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        frame = recognition._render_frame(res, i % cycle)
+        base64.b64encode(PixooClient._image_to_rgb_bytes(frame))
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    del frame
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "cover_px": cover_size,
+        "canvas_px": canvas_size,
+        "text": text_case,
+        "cycle_px": res["cycle"],
+        "frames": frames,
+        "prepare_ms": round(statistics.median(prepare_ms), 3),
+        "fps": round(frames / wall_s, 1),
+        "cpu_ms_per_frame": round(cpu_s * 1000.0 / frames, 3),
+        "render_us_per_frame": round(render_s * 1e6 / frames, 1),
+        "encode_us_per_frame": round(encode_s * 1e6 / frames, 1),
+        "wire_bytes_per_frame": round(mock.bytes_received / max(1, mock.frames)),
+        "requests_per_frame": round(mock.requests / frames, 2),
+        "connections": mock.connections,
+        "alloc_peak_kib_per_frame": round(statistics.mean(peaks) / 1024.0, 2),
+        "alloc_retained_blocks": retained_blocks,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless render + send benchmark against a mock Pixoo.")
+    parser.add_argument("--cover-sizes", default="300,640,1000")
+    parser.add_argument("--canvas-sizes", default="32,64")
+    parser.add_argument("--texts", default=",".join(TEXT_CASES))
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--json", default="", help="write machine-readable results to this file ('-' for stdout)")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="vinylpi-bench-"))
+    os.environ["VINYLPI_DATA_DIR"] = str(work_dir)
+
+    from vinylpi.paths import BASE_DIR
+    from vinylpi.integrations.mock_pixoo import MockPixooServer
+
+    shutil.copy(BASE_DIR / "data" / "config.json", work_dir / "config.json")
+    mock = MockPixooServer(latency_ms=args.latency_ms).start()
+
+    results = []
+    try:
+        for cover_size in (int(v) for v in args.cover_sizes.split(",")):
+            cover_path = work_dir / f"cover_{cover_size}.jpg"
+            make_cover(cover_path, cover_size)
+            for canvas_size in (int(v) for v in args.canvas_sizes.split(",")):
+                for text_case in args.texts.split(","):
+                    result = run_case(cover_path, cover_size, canvas_size, text_case, args.frames, args.repeats, mock)
+                    results.append(result)
+                    if args.json != "-":
+                        print(
+                            f"cover {result['cover_px']:>4}px  canvas {result['canvas_px']:>2}  {result['text']:<13}"
+                            f"  prepare {result['prepare_ms']:7.2f} ms  {result['fps']:7.1f} fps"
+                            f"  cpu {result['cpu_ms_per_frame']:6.3f} ms/frame"
+                            f"  render {result['render_us_per_frame']:6.1f} us"
+                            f"  {result['wire_bytes_per_frame']:>6} B/frame"
+                            f"  peak {result['alloc_peak_kib_per_frame']:5.1f} KiB"
+                        )
+    finally:
+        mock.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "pillow": Image.__version__,
+            "numpy": np.__version__,
+            "latency_ms": args.latency_ms,
+            "results": results,
+        }
+        text = json.dumps(report, indent=2)
+        if args.json == "-":
+            print(text)
+        else:
+            Path(args.json).write_text(text, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import base64
+import timeit
+
+import numpy as np
+from PIL import Image
+
+from vinylpi.integrations.divoom_api import PixooClient
+
+
+def legacy_rgb_bytes(img: Image.Image) -> bytes:
+    width, height = img.size
+    buf = bytearray()
+    for y in range(height):
+        for x in range(width):
+            r, g, b = img.getpixel((x, y))
+            buf.extend((r, g, b))
+    return bytes(buf)
+
+
+def make_frame(size: int = 64) -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (size, size, 3), dtype=np.uint8), "RGB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-frame cost of building the Pixoo PicData payload.")
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    img = make_frame(args.size)
+    arr = np.asarray(img)
+    assert legacy_rgb_bytes(img) == bytes(PixooClient._image_to_rgb_bytes(img))
+    assert legacy_rgb_bytes(img) == bytes(PixooClient._image_to_rgb_bytes(arr))
+
+    cases = {
+        "getpixel loop (old)": lambda: base64.b64encode(legacy_rgb_bytes(img)),
+        "PIL tobytes": lambda: base64.b64encode(PixooClient._image_to_rgb_bytes(img)),
+        "numpy view": lambda: base64.b64encode(PixooClient._image_to_rgb_bytes(arr)),
+    }
+
+    print(f"{args.size}x{args.size} frame -> base64 PicData, {args.number} runs each")
+    baseline = None
+    for name, fn in cases.items():
+        per_frame = min(timeit.repeat(fn, number=args.number, repeat=3)) / args.number
+        baseline = baseline or per_frame
+        print(f"  {name:<22} {per_frame * 1e6:9.1f} us/frame  ({baseline / per_frame:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
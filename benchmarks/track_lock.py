@@ -0,0 +1,112 @@
+import argparse
+import itertools
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from vinylpi.core.audio_sources import REPLAY_EXTENSIONS
+from vinylpi.core.fingerprint import compute_fingerprint, similarity
+
+SYNTHETIC_RATE = 44100
+
+
+def synthetic_track(seed: int, seconds: float = 60.0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    root = 110.0 * 2 ** (rng.integers(0, 12) / 12)
+    scale = np.array([0, 2, 4, 5, 7, 9, 11] if rng.integers(2) == 0 else [0, 2, 3, 5, 7, 8, 10])
+    progression = rng.choice(7, 4)
+    harmonics = rng.uniform(0.1, 1.0, 6)
+    harmonics[0] = 1.0
+    note_seconds = float(rng.choice([0.125, 0.25, 0.375, 0.5]))
+    drums = rng.uniform(0.0, 0.6)
+
+    t = np.arange(int(note_seconds * SYNTHETIC_RATE)) / SYNTHETIC_RATE
+    envelope = np.exp(-rng.uniform(1.0, 6.0) * t)
+
+    notes = []
+    for i in range(int(seconds / note_seconds)):
+        chord = progression[(i // 8) % 4]
+        degree = (chord + rng.choice([0, 2, 4])) % 7
+        f = root * 2 ** ((scale[degree] + 12 * rng.integers(1, 3)) / 12)
+        x = sum(h * np.sin(2 * np.pi * f * (k + 1) * t) for k, h in enumerate(harmonics)) * envelope
+        x += 0.5 * np.sin(2 * np.pi * root * 2 ** (scale[chord] / 12) * t)
+        if i % 2 == 0:
+            x += drums * rng.standard_normal(len(t)) * np.exp(-30 * t)
+        notes.append(x)
+
+    y = np.concatenate(notes)
+    y += 0.02 * rng.standard_normal(len(y))
+    return (y / np.abs(y).max() * 0.8 * 32767).astype(np.int16)
+
+
+def track_windows(audio: np.ndarray, sample_rate: int, window_seconds: float, count: int) -> list[np.ndarray]:
+    n = int(window_seconds * sample_rate)
+    margin = int(5 * sample_rate)
+    usable = len(audio) - 2 * margin - n
+    if usable <= 0:
+        return []
+    starts = np.linspace(margin, margin + usable, count).astype(int)
+    return [audio[s:s + n] for s in starts]
+
+
+def load_tracks(args) -> list[tuple[str, list]]:
+    tracks = []
+    if args.tracks:
+        files = sorted(p for p in Path(args.tracks).iterdir() if p.suffix.lower() in REPLAY_EXTENSIONS)
+        for path in files:
+            audio, sample_rate = sf.read(path, dtype="int16", always_2d=True)
+            windows = track_windows(audio, sample_rate, args.window_seconds, args.windows)
+            if len(windows) >= 2:
+                tracks.append((path.name, [compute_fingerprint(w, sample_rate) for w in windows]))
+    else:
+        for seed in range(args.synthetic):
+            audio = synthetic_track(seed)
+            windows = track_windows(audio, SYNTHETIC_RATE, args.window_seconds, args.windows)
+            tracks.append((f"synthetic-{seed}", [compute_fingerprint(w, SYNTHETIC_RATE) for w in windows]))
+    return tracks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibrate recognition.same_track.similarity_threshold.")
+    parser.add_argument("--tracks", default="", help="directory with one recording (WAV/FLAC) per track")
+    parser.add_argument("--synthetic", type=int, default=40, help="number of generated tracks when --tracks is not given")
+    parser.add_argument("--windows", type=int, default=6, help="windows sampled per track")
+    parser.add_argument("--window-seconds", type=float, default=4.0)
+    parser.add_argument("--max-false", type=float, default=0.01, help="accepted share of different-track pairs above the threshold")
+    args = parser.parse_args()
+
+    tracks = load_tracks(args)
+    if len(tracks) < 2:
+        raise SystemExit("Need at least two tracks that are longer than window + 10 s.")
+
+    same = np.array([
+        similarity(a, b)
+        for _, fps in tracks
+        for a, b in itertools.combinations(fps, 2)
+    ])
+    diff = np.array([
+        similarity(fps_a[0], b)
+        for (_, fps_a), (_, fps_b) in itertools.permutations(tracks, 2)
+        for b in fps_b
+    ])
+
+    print(f"{len(tracks)} tracks, {len(same)} same-track pairs, {len(diff)} different-track pairs")
+    print(f"same-track  p5 {np.percentile(same, 5):.3f}  p25 {np.percentile(same, 25):.3f}  median {np.median(same):.3f}")
+    print(f"diff-track  median {np.median(diff):.3f}  p95 {np.percentile(diff, 95):.3f}  p99 {np.percentile(diff, 99):.3f}  max {diff.max():.3f}")
+    print()
+    print("threshold  same-track kept  different-track accepted")
+
+    suggested = None
+    for threshold in np.arange(0.5, 1.0, 0.05):
+        false_rate = float(np.mean(diff >= threshold))
+        print(f"   {threshold:.2f}        {np.mean(same >= threshold):6.1%}          {false_rate:7.2%}")
+        if suggested is None and false_rate <= args.max_false:
+            suggested = threshold
+
+    if suggested is not None:
+        print(f"\nSuggested similarity_threshold: {suggested:.2f} (<= {args.max_false:.0%} different-track pairs accepted)")
+
+
+if __name__ == "__main__":
+    main()
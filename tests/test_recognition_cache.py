@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+os.environ.setdefault("VINYLPI_DATA_DIR", tempfile.mkdtemp(prefix="vinylpi-test-"))
+
+from pathlib import Path
+
+import numpy as np
+
+from vinylpi.core.fingerprint import compute_landmarks
+from vinylpi.core.recognition_cache import RecognitionCache
+
+SR = 44100
+
+
+def _melody(seed: int, seconds: float = 20.0, note_seconds: float = 0.25) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    scale = np.array([0, 2, 4, 5, 7, 9, 11, 12, 14, 16])
+    root = rng.choice([110.0, 130.8, 146.8, 164.8, 196.0])
+    t = np.arange(int(note_seconds * SR)) / SR
+
+    notes = []
+    for _ in range(int(seconds / note_seconds)):
+        f = root * 2 ** ((scale[rng.integers(len(scale))] + 12 * rng.integers(1, 3)) / 12)
+        notes.append(sum(np.sin(2 * np.pi * f * k * t) / k for k in (1, 2, 3)) * np.exp(-3 * t))
+    y = np.concatenate(notes)
+
+    tt = np.arange(len(y)) / SR
+    y += 0.6 * np.sin(2 * np.pi * root * tt) + 0.3 * np.sin(2 * np.pi * root * 2 * tt)
+    y += 0.05 * rng.standard_normal(len(y))
+    return (y / np.abs(y).max() * 0.8 * 32767).astype(np.int16)
+
+
+def _landmarks(track: np.ndarray, start: float, seconds: float = 4.0):
+    return compute_landmarks(track[int(start * SR):int((start + seconds) * SR)], SR)
+
+
+def _cache(tmp_path: Path) -> RecognitionCache:
+    return RecognitionCache(tmp_path / "cache.json", min_age=0)
+
+
+def test_overlapping_window_of_same_track_hits(tmp_path):
+    track = _melody(1)
+    cache = _cache(tmp_path)
+    cache.store(*_landmarks(track, 8.0), ("A", "a", None, None))
+
+    assert cache.lookup(*_landmarks(track, 9.0)) == ("A", "a", None, None)
+
+
+def test_unrelated_window_misses(tmp_path):
+    track = _melody(1)
+    cache = _cache(tmp_path)
+    cache.store(*_landmarks(track, 8.0), ("A", "a", None, None))
+
+    for seed in range(100, 130):
+        assert cache.lookup(*_landmarks(_melody(seed, seconds=10.0), 4.0)) is None, seed
+
+
+def test_fresh_entries_are_not_matched(tmp_path):
+    track = _melody(2)
+    cache = RecognitionCache(tmp_path / "cache.json", min_age=60)
+    cache.store(*_landmarks(track, 8.0), ("B", "b", None, None))
+
+    assert cache.lookup(*_landmarks(track, 9.0)) is None
@@ -5,10 +5,26 @@ from vinylpi.paths import CONFIG_PATH
 
 CONFIG_DEFAULTS = {
     "audio": {
+        "source": "device",
         "device_name_contains": "USB AUDIO",
         "sample_seconds": 4,
         "sample_rate": 44100,
-        "channels": 1
+        "channels": 1,
+        "buffer_seconds": 15,
+        "recognition_sample_rate": 16000,
+        "replay_path": "",
+        "replay_speed": 1.0,
+        "replay_loop": False,
+        "gate": {
+            "enabled": True,
+            "silence_dbfs": -55,
+            "noise_flatness": 0.4
+        },
+        "gap_detection": {
+            "enabled": True,
+            "drop_db": 18,
+            "min_gap_seconds": 1.0
+        }
     },
     "image": {
         "canvas_size": 64,
@@ -25,7 +41,20 @@ CONFIG_DEFAULTS = {
         "uppercase": True,
         "preview_scale": 8,
         "marquee_speed": 20,
-        "sleep_seconds": 0.01
+        "sleep_seconds": 0.01,
+        "display_mode": "stream",
+        "animation": {
+            "max_frames": 59
+        },
+        "device_text": {
+            "font": 2,
+            "y_offset": 0
+        },
+        "cover_cache": {
+            "enabled": True,
+            "max_mb": 20,
+            "revalidate_hours": 168
+        }
     },
     "divoom": {
         "ip": "",
@@ -34,6 +63,11 @@ CONFIG_DEFAULTS = {
         "device_mac": "",
         "timeout": 2.0,
         "auto_reset_gif_id": False,
+        "http": {
+            "pool_maxsize": 2,
+            "retries": 1,
+            "backoff_seconds": 0.05
+        },
         "discovery": {
             "enabled": True,
             "subnet_prefix": "192.168.2.",
@@ -52,9 +86,44 @@ CONFIG_DEFAULTS = {
         "image_path": "assets/fallback/fallback.png",
         "allowed_failures": 3
     },
+    "recognition": {
+        "backends": ["shazam"],
+        "http_url": "",
+        "retries": 0,
+        "same_track": {
+            "enabled": True,
+            # calibrated with benchmarks.track_lock: ~0.6% different-track pairs above 0.85
+            "similarity_threshold": 0.85,
+            "max_skips": 10
+        },
+        "cache": {
+            "enabled": True,
+            "max_entries": 300,
+            "min_matches": 50,
+            "min_fraction": 0.25,
+            "min_margin": 1.5,
+            "min_age_seconds": 10
+        },
+        "hedging": {
+            "enabled": False,
+            "concurrency": 2,
+            "offset_seconds": 3,
+            "max_requests_per_minute": 12
+        }
+    },
     "behavior": {
         "loop_delay_seconds": 1,
-        "auto_sleep": 30
+        "auto_sleep": 30,
+        "pipeline": {
+            "enabled": True,
+            "queue_size": 2,
+            "max_window_age_seconds": 5
+        },
+        "adaptive_polling": {
+            "enabled": True,
+            "max_delay_seconds": 20,
+            "boundary_window_seconds": 30
+        }
     },
     "homeassistant": {
         "use_ha": True,
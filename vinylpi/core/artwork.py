@@ -0,0 +1,155 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from vinylpi.web.services.config import read_config
+from vinylpi.core.metrics import update_metrics
+
+SAMPLE_SIZE = 64
+_NUM_COLORS = 8
+_KMEANS_ITERATIONS = 6
+_MEMO_SIZE = 64
+_LUMA = np.array([0.2126, 0.7152, 0.0722])
+
+
+@dataclass(frozen=True)
+class ArtworkColors:
+    bg_color: tuple[int, int, int]
+    text_color: tuple[int, int, int]
+    palette: tuple[tuple[int, int, int], ...]
+    counts: tuple[int, ...]
+
+
+_memo: OrderedDict[tuple, ArtworkColors] = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "last_ms": 0.0}
+
+
+def _sample_pixels(cover_img: Image.Image) -> np.ndarray:
+    small = cover_img.info.get("color_sample")
+    if small is None:
+        small = cover_img.resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BILINEAR)
+    return np.asarray(small.convert("RGB"), dtype=np.float32).reshape(-1, 3)
+
+
+def _kmeans(pixels: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    q = pixels.astype(np.int32) >> 4
+    bin_idx = (q[:, 0] << 8) | (q[:, 1] << 4) | q[:, 2]
+    bins = np.bincount(bin_idx, minlength=4096)
+    occupied = np.nonzero(bins)[0]
+    weights = bins[occupied].astype(np.float32)
+    points = np.stack(
+        [np.bincount(bin_idx, weights=pixels[:, ch], minlength=4096)[occupied] for ch in range(3)],
+        axis=1,
+    ) / weights[:, None]
+
+    centers = points[np.argsort(weights, kind="stable")[::-1][:k]].copy()
+
+    for _ in range(_KMEANS_ITERATIONS):
+        labels = np.square(points[:, None, :] - centers[None, :, :]).sum(axis=2).argmin(axis=1)
+        counts = np.bincount(labels, weights=weights, minlength=len(centers))
+        used = counts > 0
+        for ch in range(3):
+            sums = np.bincount(labels, weights=points[:, ch] * weights, minlength=len(centers))
+            centers[used, ch] = sums[used] / counts[used]
+
+    labels = np.square(points[:, None, :] - centers[None, :, :]).sum(axis=2).argmin(axis=1)
+    counts = np.bincount(labels, weights=weights, minlength=len(centers)).astype(np.int64)
+    order = np.argsort(counts, kind="stable")[::-1]
+    order = order[counts[order] > 0]
+    return np.clip(np.round(centers[order]), 0, 255).astype(np.int32), counts[order]
+
+
+def _pick_background(palette: np.ndarray, counts: np.ndarray) -> tuple[int, int, int]:
+    if len(palette) == 0:
+        return (40, 40, 40)
+
+    hi = palette.max(axis=1)
+    lo = palette.min(axis=1)
+    saturation = np.where(hi > 0, (hi - lo) / np.maximum(hi, 1), 0.0)
+    lum = palette @ _LUMA
+
+    score = counts.astype(np.float64)
+    score[0] *= 0.7
+    valid = (saturation >= 0.25) & (lum >= 30) & (lum <= 230)
+
+    if valid.any():
+        base = palette[np.argmax(np.where(valid, score, -1.0))]
+    else:
+        base = palette[0]
+
+    r, g, b = (int(v) for v in base)
+    lum = float(base @ _LUMA)
+    target_min, target_max = 60, 180
+
+    if lum < target_min:
+        factor = target_min / max(lum, 1)
+        r = min(int(r * factor), 255)
+        g = min(int(g * factor), 255)
+        b = min(int(b * factor), 255)
+    elif lum > target_max:
+        factor = target_max / lum
+        r = int(r * factor)
+        g = int(g * factor)
+        b = int(b * factor)
+
+    return (r, g, b)
+
+
+def _compute(pixels: np.ndarray, lum_threshold: float) -> ArtworkColors:
+    palette, counts = _kmeans(pixels, _NUM_COLORS)
+    bg_color = _pick_background(palette, counts)
+    lum = float(np.dot(bg_color, _LUMA))
+    text_color = (0, 0, 0) if lum > lum_threshold else (255, 255, 255)
+
+    return ArtworkColors(
+        bg_color=bg_color,
+        text_color=text_color,
+        palette=tuple(tuple(int(v) for v in c) for c in palette),
+        counts=tuple(int(c) for c in counts),
+    )
+
+
+def analyze_artwork(cover_img: Image.Image, cover_url: Optional[str] = None) -> ArtworkColors:
+    CONFIG = read_config()
+    debug_log = CONFIG["debug"]["logs"]
+    lum_threshold = CONFIG["image"].get("lum_threshold", 128)
+
+    with _lock:
+        pixels = None
+        source = cover_url
+        if not source:
+            pixels = _sample_pixels(cover_img)
+            source = hashlib.blake2b(pixels.tobytes(), digest_size=16).hexdigest()
+        key = (source, lum_threshold)
+
+        colors = _memo.get(key)
+        if colors is not None:
+            _memo.move_to_end(key)
+            _stats["hits"] += 1
+            update_metrics("artwork", dict(_stats))
+            return colors
+
+        start = time.perf_counter()
+        if pixels is None:
+            pixels = _sample_pixels(cover_img)
+        colors = _compute(pixels, lum_threshold)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        _memo[key] = colors
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+        _stats["misses"] += 1
+        _stats["last_ms"] = round(elapsed_ms, 2)
+        update_metrics("artwork", dict(_stats))
+
+    if debug_log:
+        print(f"Artwork colours: bg={colors.bg_color} text={colors.text_color} ({elapsed_ms:.1f} ms)")
+    return colors
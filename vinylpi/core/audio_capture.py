@@ -1,11 +1,20 @@
-import sounddevice as sd
 import soundfile as sf
+import numpy as np
 import io
+import threading
+import time
+from pathlib import Path
+from typing import Optional
 
 from vinylpi.web.services.config import read_config
+from vinylpi.core.audio_gate import GapDetector, to_mono_float
+from vinylpi.core.metrics import update_metrics
+from vinylpi.core.audio_sources import AudioSource, DeviceSource, FileReplaySource, list_replay_files
 
 
 def auto_detect_usb_device():
+    import sounddevice as sd
+
     cfg = read_config()
     needle = (cfg["audio"]["device_name_contains"] or "").upper()
     debug_log = bool(cfg["debug"]["logs"])
@@ -22,28 +31,196 @@ def auto_detect_usb_device():
     print("No appropriate audio device was found. Try using 'arecord -l'\n Set the name in the config.json file.")
     return None
 
-def record_sample():
-    cfg = read_config()
-    debug_log = bool(cfg["debug"]["logs"])
+
+_source: Optional[AudioSource] = None
+_source_key: Optional[tuple] = None
+_source_lock = threading.Lock()
+
+
+def _create_source(cfg: dict) -> AudioSource:
     audio_cfg = cfg["audio"]
-    debug_cfg = cfg["debug"]
+    debug_log = bool(cfg["debug"]["logs"])
 
     sample_rate = int(audio_cfg["sample_rate"])
-    seconds = float(audio_cfg["sample_seconds"])
     channels = int(audio_cfg["channels"])
-    debug_wav_path = debug_cfg.get("wav_path") or ""
+    seconds = float(audio_cfg["sample_seconds"])
+    buffer_seconds = max(float(audio_cfg.get("buffer_seconds", 15)), seconds)
+
+    if audio_cfg.get("source", "device") == "file":
+        replay_path = audio_cfg.get("replay_path") or ""
+        return FileReplaySource(
+            list_replay_files(replay_path),
+            channels=channels,
+            buffer_seconds=buffer_seconds,
+            speed=float(audio_cfg.get("replay_speed", 1.0)),
+            loop=bool(audio_cfg.get("replay_loop", False)),
+            debug_log=debug_log,
+        )
+
+    return DeviceSource(auto_detect_usb_device(), sample_rate, channels, buffer_seconds)
+
+
+def _source_key_for(cfg: dict) -> tuple:
+    audio_cfg = cfg["audio"]
+    return (
+        audio_cfg.get("source", "device"),
+        audio_cfg.get("replay_path"),
+        audio_cfg.get("replay_speed"),
+        audio_cfg.get("replay_loop"),
+        audio_cfg["device_name_contains"],
+        int(audio_cfg["sample_rate"]),
+        int(audio_cfg["channels"]),
+        max(float(audio_cfg.get("buffer_seconds", 15)), float(audio_cfg["sample_seconds"])),
+    )
+
+
+def get_audio_source() -> Optional[AudioSource]:
+    global _source, _source_key
+
+    cfg = read_config()
+    debug_log = bool(cfg["debug"]["logs"])
+    key = _source_key_for(cfg)
+
+    with _source_lock:
+        if _source is not None and key != _source_key:
+            if debug_log:
+                print("Audio settings changed, restarting audio source.")
+            _source.stop()
+            _source = None
+
+        if _source is not None and not _source.running and not _source.finished:
+            _source.stop()
+            _source = None
+
+        if _source is None:
+            try:
+                source = _create_source(cfg)
+                source.start()
+            except Exception as e:
+                print(f"Could not open audio source: {e}")
+                return None
+            if debug_log:
+                print(
+                    f"{type(source).__name__} started ({source.sample_rate} Hz, "
+                    f"{source.channels} ch, {source.buffer_seconds:.0f}s ring buffer)."
+                )
+            _source = source
+            _source_key = key
+
+        _configure_gap_detector(_source, cfg)
+        return _source
+
+
+def _configure_gap_detector(source: AudioSource, cfg: dict) -> None:
+    gap_cfg = cfg["audio"].get("gap_detection", {})
+    if not gap_cfg.get("enabled", True):
+        source.gap_detector = None
+        return
+
+    drop_db = float(gap_cfg.get("drop_db", 18))
+    min_gap_seconds = float(gap_cfg.get("min_gap_seconds", 1.0))
+    if source.gap_detector is None:
+        source.gap_detector = GapDetector(source.sample_rate, drop_db, min_gap_seconds)
+    else:
+        source.gap_detector.configure(drop_db, min_gap_seconds)
 
-    audio = sd.rec(int(seconds * sample_rate), samplerate=sample_rate,
-                   channels=channels, dtype="int16")
-    sd.wait()
+
+def pop_track_boundary() -> Optional[float]:
+    source = _source
+    if source is None or source.gap_detector is None:
+        return None
+
+    detector = source.gap_detector
+    boundary = detector.pop_boundary()
+    if boundary is not None:
+        update_metrics("gap_detector", {
+            "boundaries": detector.boundaries,
+            "music_dbfs": round(detector.music_dbfs or 0.0, 1),
+        })
+    return boundary
+
+
+def stop_audio_source() -> None:
+    global _source
+
+    with _source_lock:
+        if _source is not None:
+            _source.stop()
+            _source = None
+
+
+def is_replay_finished() -> bool:
+    return _source is not None and _source.finished
+
+
+def capture_window(extra_seconds: float = 0.0) -> Optional[tuple[np.ndarray, int]]:
+    cfg = read_config()
+    seconds = float(cfg["audio"]["sample_seconds"]) + extra_seconds
+
+    source = get_audio_source()
+    if source is None:
+        return None
+
+    audio = source.read_latest(seconds)
+    if audio is None:
+        return None
+
+    return audio, source.sample_rate
+
+
+def resample(x: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    if src_rate == dst_rate or len(x) == 0:
+        return x
+
+    n_out = int(round(len(x) * dst_rate / src_rate))
+    spectrum = np.fft.rfft(x)
+    keep = min(len(spectrum), n_out // 2 + 1)
+    out = np.fft.irfft(spectrum[:keep], n=n_out)
+    return (out * (n_out / len(x))).astype(np.float32)
+
+
+def encode_for_recognition(audio: np.ndarray, sample_rate: int, save_debug: bool = True) -> bytes:
+    cfg = read_config()
+    debug_log = bool(cfg["debug"]["logs"])
+    debug_wav_path = cfg["debug"].get("wav_path") or ""
+    target_rate = int(cfg["audio"].get("recognition_sample_rate", 16000)) or sample_rate
+
+    cpu_start = time.thread_time()
+
+    mono = to_mono_float(audio)
+    if target_rate < sample_rate:
+        mono = resample(mono, sample_rate, target_rate)
+    else:
+        target_rate = sample_rate
+    pcm = np.clip(mono * 32768.0, -32768, 32767).astype(np.int16)
 
     buffer = io.BytesIO()
-    sf.write(buffer, audio, sample_rate, format="WAV")
+    sf.write(buffer, pcm, target_rate, format="WAV", subtype="PCM_16")
     wav_bytes = buffer.getvalue()
 
-    if debug_wav_path:
-        sf.write(debug_wav_path, audio, sample_rate, format="WAV")
+    cpu_ms = (time.thread_time() - cpu_start) * 1000.0
+    update_metrics("encoder", {
+        "payload_bytes": len(wav_bytes),
+        "raw_bytes": int(audio.nbytes),
+        "sample_rate": target_rate,
+        "cpu_ms": round(cpu_ms, 2),
+    })
+
+    if debug_log:
+        print(f"Encoded {len(wav_bytes) / 1024:.0f} KiB payload at {target_rate} Hz (raw {audio.nbytes / 1024:.0f} KiB, {cpu_ms:.1f} ms CPU).")
+
+    if debug_wav_path and save_debug:
+        Path(debug_wav_path).write_bytes(wav_bytes)
         if debug_log:
             print(f"Saved WAV file at: {debug_wav_path}")
 
-    return wav_bytes
\ No newline at end of file
+    return wav_bytes
+
+
+def record_sample():
+    window = capture_window()
+    if window is None:
+        return None
+
+    audio, sample_rate = window
+    return encode_for_recognition(audio, sample_rate)
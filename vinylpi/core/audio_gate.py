@@ -0,0 +1,157 @@
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import numpy as np
+
+from vinylpi.web.services.config import read_config
+from vinylpi.core.metrics import update_metrics
+
+SILENCE = "silence"
+NOISE = "noise"
+MUSIC = "music"
+
+_FRAME_SIZE = 2048
+_BAND_HZ = (100.0, 8000.0)
+
+
+@dataclass
+class GateStats:
+    windows: int = 0
+    silence: int = 0
+    noise: int = 0
+    music: int = 0
+    last_verdict: str = ""
+    last_rms_dbfs: float = 0.0
+    last_flatness: float = 0.0
+
+
+_stats = GateStats()
+
+
+def to_mono_float(audio: np.ndarray) -> np.ndarray:
+    x = audio.astype(np.float32)
+    if x.ndim > 1:
+        x = x.mean(axis=1)
+    return x / 32768.0
+
+
+def rms_dbfs(x: np.ndarray) -> float:
+    if x.size == 0:
+        return -120.0
+    rms = float(np.sqrt(np.mean(np.square(x, dtype=np.float64))))
+    return float(20.0 * np.log10(max(rms, 1e-6)))
+
+
+def spectral_flatness(x: np.ndarray, sample_rate: int) -> float:
+    n_frames = len(x) // _FRAME_SIZE
+    if n_frames == 0:
+        return 1.0
+
+    frames = x[: n_frames * _FRAME_SIZE].reshape(n_frames, _FRAME_SIZE)
+    frames = frames * np.hanning(_FRAME_SIZE).astype(np.float32)
+    power = np.square(np.abs(np.fft.rfft(frames, axis=1))) + 1e-12
+
+    freqs = np.fft.rfftfreq(_FRAME_SIZE, d=1.0 / sample_rate)
+    band = (freqs >= _BAND_HZ[0]) & (freqs <= _BAND_HZ[1])
+    power = power[:, band]
+
+    geo_mean = np.exp(np.mean(np.log(power), axis=1))
+    arith_mean = np.mean(power, axis=1)
+    return float(np.median(geo_mean / arith_mean))
+
+
+def classify_window(audio: np.ndarray, sample_rate: int) -> tuple[str, float, float]:
+    cfg = read_config()
+    gate_cfg = cfg["audio"].get("gate", {})
+    silence_dbfs = float(gate_cfg.get("silence_dbfs", -55))
+    noise_flatness = float(gate_cfg.get("noise_flatness", 0.4))
+
+    x = to_mono_float(audio)
+    level = rms_dbfs(x)
+    if level < silence_dbfs:
+        return SILENCE, level, 1.0
+
+    flatness = spectral_flatness(x, sample_rate)
+    if flatness > noise_flatness:
+        return NOISE, level, flatness
+
+    return MUSIC, level, flatness
+
+
+def gate_window(audio: np.ndarray, sample_rate: int) -> str:
+    cfg = read_config()
+    debug_log = bool(cfg["debug"]["logs"])
+    if not cfg["audio"].get("gate", {}).get("enabled", True):
+        return MUSIC
+
+    verdict, level, flatness = classify_window(audio, sample_rate)
+
+    _stats.windows += 1
+    setattr(_stats, verdict, getattr(_stats, verdict) + 1)
+    _stats.last_verdict = verdict
+    _stats.last_rms_dbfs = round(level, 1)
+    _stats.last_flatness = round(flatness, 3)
+    update_metrics("audio_gate", asdict(_stats))
+
+    if debug_log:
+        print(f"Audio gate: {verdict} (rms={level:.1f} dBFS, flatness={flatness:.3f})")
+
+    return verdict
+
+
+class GapDetector:
+    MUSIC_LEVEL_TIME_CONSTANT = 5.0
+
+    def __init__(self, sample_rate: int, drop_db: float = 18.0, min_gap_seconds: float = 1.0):
+        self.sample_rate = sample_rate
+        self.drop_db = drop_db
+        self.min_gap_seconds = min_gap_seconds
+
+        self.boundaries = 0
+        self.music_dbfs: Optional[float] = None
+        self.in_gap = False
+
+        self._quiet_for = 0.0
+        self._pending: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def configure(self, drop_db: float, min_gap_seconds: float) -> None:
+        self.drop_db = drop_db
+        self.min_gap_seconds = min_gap_seconds
+
+    def feed(self, block: np.ndarray) -> None:
+        if len(block) == 0:
+            return
+
+        duration = len(block) / self.sample_rate
+        level = rms_dbfs(to_mono_float(block))
+
+        if self.music_dbfs is None:
+            self.music_dbfs = level
+            return
+
+        if not self.in_gap:
+            if level < self.music_dbfs - self.drop_db:
+                self._quiet_for += duration
+                if self._quiet_for >= self.min_gap_seconds:
+                    self.in_gap = True
+            else:
+                self._quiet_for = 0.0
+                alpha = min(1.0, duration / self.MUSIC_LEVEL_TIME_CONSTANT)
+                self.music_dbfs += alpha * (level - self.music_dbfs)
+            return
+
+        if level >= self.music_dbfs - self.drop_db / 2:
+            self.in_gap = False
+            self._quiet_for = 0.0
+            with self._lock:
+                self._pending = time.monotonic()
+                self.boundaries += 1
+
+    def pop_boundary(self) -> Optional[float]:
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+        return pending
@@ -0,0 +1,220 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+from vinylpi.core.audio_gate import GapDetector
+
+REPLAY_EXTENSIONS = {".wav", ".flac"}
+
+
+class AudioSource(ABC):
+    def __init__(self, sample_rate: int, channels: int, buffer_seconds: float):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.buffer_seconds = buffer_seconds
+
+        self._capacity = int(buffer_seconds * sample_rate)
+        self._buffer = np.zeros((self._capacity, channels), dtype=np.int16)
+        self._write_pos = 0
+        self._frames_written = 0
+        self._lock = threading.Lock()
+        self.gap_detector: Optional[GapDetector] = None
+
+    @property
+    @abstractmethod
+    def running(self) -> bool:
+        ...
+
+    @property
+    def finished(self) -> bool:
+        return False
+
+    @abstractmethod
+    def start(self) -> None:
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        ...
+
+    def _push(self, data: np.ndarray) -> None:
+        if len(data) > self._capacity:
+            data = data[-self._capacity:]
+        n = len(data)
+
+        with self._lock:
+            start = self._write_pos
+            end = start + n
+            if end <= self._capacity:
+                self._buffer[start:end] = data
+            else:
+                first = self._capacity - start
+                self._buffer[start:] = data[:first]
+                self._buffer[:n - first] = data[first:]
+
+            self._write_pos = end % self._capacity
+            self._frames_written += n
+
+        if self.gap_detector is not None:
+            self.gap_detector.feed(data)
+
+    def read_latest(self, seconds: float, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        n = min(int(seconds * self.sample_rate), self._capacity)
+        if n <= 0 or self.finished:
+            return None
+
+        deadline = time.monotonic() + (timeout if timeout is not None else seconds * 2 + 1)
+        while True:
+            with self._lock:
+                if self._frames_written >= n:
+                    start = (self._write_pos - n) % self._capacity
+                    if start + n <= self._capacity:
+                        return self._buffer[start:start + n].copy()
+                    return np.concatenate((self._buffer[start:], self._buffer[:self._write_pos]))
+
+            if not self.running or time.monotonic() >= deadline:
+                return None
+            time.sleep(0.05)
+
+
+class DeviceSource(AudioSource):
+    def __init__(self, device: Optional[int], sample_rate: int, channels: int, buffer_seconds: float):
+        super().__init__(sample_rate, channels, buffer_seconds)
+        self.device = device
+        self.overflows = 0
+        self._stream = None
+
+    @property
+    def running(self) -> bool:
+        return self._stream is not None and self._stream.active
+
+    def start(self) -> None:
+        import sounddevice as sd
+
+        if self._stream is not None:
+            return
+
+        self._stream = sd.InputStream(
+            device=self.device,
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype="int16",
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def stop(self) -> None:
+        if self._stream is None:
+            return
+
+        try:
+            self._stream.stop()
+            self._stream.close()
+        finally:
+            self._stream = None
+
+    def _callback(self, indata, frames, time_info, status) -> None:
+        if status and status.input_overflow:
+            self.overflows += 1
+        self._push(indata)
+
+
+def list_replay_files(path: str | Path) -> list[Path]:
+    p = Path(path)
+    if p.is_file():
+        return [p]
+    if p.is_dir():
+        return sorted(f for f in p.iterdir() if f.is_file() and f.suffix.lower() in REPLAY_EXTENSIONS)
+    return []
+
+
+class FileReplaySource(AudioSource):
+    BLOCK_SECONDS = 0.1
+
+    def __init__(self, files: list[Path], channels: int, buffer_seconds: float, speed: float = 1.0, loop: bool = False, debug_log: bool = False):
+        if not files:
+            raise ValueError("FileReplaySource: no WAV/FLAC files to replay")
+
+        sample_rate = sf.info(str(files[0])).samplerate
+        super().__init__(sample_rate, channels, buffer_seconds)
+
+        self.files = files
+        self.speed = speed
+        self.loop = loop
+        self.debug_log = debug_log
+        self.current_file: Optional[Path] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self._stop_event.clear()
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _fit_channels(self, block: np.ndarray) -> np.ndarray:
+        if block.shape[1] == self.channels:
+            return block
+        mono = block.mean(axis=1, keepdims=True).astype(np.int16)
+        return np.repeat(mono, self.channels, axis=1)
+
+    def _run(self) -> None:
+        block_frames = max(1, int(self.sample_rate * self.BLOCK_SECONDS))
+        started = time.monotonic()
+        pushed = 0
+
+        while not self._stop_event.is_set():
+            for path in self.files:
+                if self._stop_event.is_set():
+                    return
+
+                info = sf.info(str(path))
+                if info.samplerate != self.sample_rate:
+                    print(f"Skipping replay file {path.name}: {info.samplerate} Hz, expected {self.sample_rate} Hz.")
+                    continue
+
+                self.current_file = path
+                if self.debug_log:
+                    print(f"Replaying {path} at {self.speed:g}x")
+
+                for block in sf.blocks(str(path), blocksize=block_frames, dtype="int16", always_2d=True):
+                    if self._stop_event.is_set():
+                        return
+
+                    self._push(self._fit_channels(block))
+                    pushed += len(block)
+
+                    if self.speed > 0:
+                        due = started + pushed / (self.sample_rate * self.speed)
+                        delay = due - time.monotonic()
+                        if delay > 0 and self._stop_event.wait(delay):
+                            return
+
+            if not self.loop:
+                break
+
+        self._finished = True
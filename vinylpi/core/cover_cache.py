@@ -0,0 +1,267 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from pathlib import Path
+from typing import Optional
+
+import requests
+from PIL import Image
+
+from vinylpi.paths import COVER_CACHE_DIR
+from vinylpi.web.services.config import read_config
+from vinylpi.core.image_utils import load_image
+from vinylpi.core.metrics import update_metrics
+
+SAMPLE_SIZE = 64
+_INDEX_NAME = "index.json"
+_SAVE_INTERVAL_SECONDS = 60.0
+
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def square_cover(img: Image.Image, size: int) -> Image.Image:
+    w, h = img.size
+    side = min(w, h)
+    left = (w - side) // 2
+    top = (h - side) // 2
+    return img.crop((left, top, left + side, top + side)).resize((size, size), Image.Resampling.BILINEAR)
+
+
+class CoverCache:
+    def __init__(self, directory: Path, max_bytes: int, revalidate_after: float):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+
+        self.hits = 0
+        self.misses = 0
+        self.downloads = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+        self._index: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = 0.0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads((self.directory / _INDEX_NAME).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Could not read cover cache index, starting empty: {e}")
+            return
+
+        entries = sorted(raw.get("entries", {}).items(), key=lambda kv: kv[1].get("used_at", 0))
+        for url, meta in entries:
+            if self._original_path(meta["content"]).exists():
+                self._index[url] = meta
+
+    def _save(self) -> None:
+        path = self.directory / _INDEX_NAME
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"entries": self._index}, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def _cached_meta(self, url: str) -> Optional[dict]:
+        meta = self._index.get(url)
+        if meta is not None and not self._original_path(meta["content"]).exists():
+            return None
+        return meta
+
+    def _original_path(self, content: str) -> Path:
+        return self.directory / f"{content}.orig"
+
+    def _variant_path(self, content: str, name: str) -> Path:
+        return self.directory / f"{content}_{name}.png"
+
+    def _files_for(self, content: str) -> list[Path]:
+        return list(self.directory.glob(f"{content}*"))
+
+    def _variants(self, content: str, cover_size: int) -> tuple[Image.Image, Image.Image]:
+        builders = {
+            str(cover_size): lambda img: square_cover(img, cover_size),
+            "sample": lambda img: img.resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BILINEAR),
+        }
+
+        original = None
+        variants = []
+        for name, build in builders.items():
+            path = self._variant_path(content, name)
+            if path.exists():
+                with Image.open(path) as img:
+                    variants.append(img.convert("RGB"))
+                continue
+
+            if original is None:
+                original = load_image(str(self._original_path(content)), min_size=max(cover_size, SAMPLE_SIZE))
+            variant = build(original)
+            variant.save(path, format="PNG")
+            variants.append(variant)
+
+        return variants[0], variants[1]
+
+    def _fetch(self, url: str, meta: Optional[dict]) -> Optional[tuple[bytes, dict]]:
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            elif meta.get("checked_at"):
+                headers["If-Modified-Since"] = formatdate(meta["checked_at"], usegmt=True)
+
+        resp = requests.get(url, timeout=15, headers=headers)
+        if resp.status_code == 304 and meta is not None:
+            self.not_modified += 1
+            return None
+        resp.raise_for_status()
+
+        self.downloads += 1
+        return resp.content, {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+
+    def _store(self, url: str, data: bytes, headers: dict) -> dict:
+        content = _sha1(data)
+        original = self._original_path(content)
+        if not original.exists():
+            tmp = original.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, original)
+
+        old = self._index.get(url)
+        meta = {"content": content, **headers, "checked_at": time.time(), "used_at": time.time()}
+        self._index[url] = meta
+        if old is not None and old["content"] != content:
+            self._drop_unreferenced(old["content"])
+        return meta
+
+    def _drop_unreferenced(self, content: str) -> None:
+        if any(m["content"] == content for m in self._index.values()):
+            return
+        for path in self._files_for(content):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        sizes: dict[str, int] = {}
+        for path in self.directory.iterdir():
+            if path.name.startswith("index."):
+                continue
+            content = path.name.split(".")[0].split("_")[0]
+            sizes[content] = sizes.get(content, 0) + path.stat().st_size
+
+        live = {m["content"] for m in self._index.values()}
+        for content in set(sizes) - live:
+            self._drop_unreferenced(content)
+            sizes.pop(content)
+
+        total = sum(sizes.values())
+        while total > self.max_bytes and len(self._index) > 1:
+            url, meta = self._index.popitem(last=False)
+            self.evictions += 1
+            if meta["content"] in sizes and not any(m["content"] == meta["content"] for m in self._index.values()):
+                total -= sizes.pop(meta["content"])
+                self._drop_unreferenced(meta["content"])
+
+    def _serve(self, url: str, meta: dict, cover_size: int, stored: bool, changed: bool) -> Image.Image:
+        cover, sample = self._variants(meta["content"], cover_size)
+        cover.info["color_sample"] = sample
+
+        meta["used_at"] = time.time()
+        if next(reversed(self._index)) != url:
+            self._index.move_to_end(url)
+            self._dirty = True
+        if stored:
+            self._evict()
+        if changed or (self._dirty and time.monotonic() - self._saved_at >= _SAVE_INTERVAL_SECONDS):
+            self._save()
+        self._publish()
+        return cover
+
+    def get(self, url: str, cover_size: int) -> Image.Image:
+        with self._lock:
+            meta = self._cached_meta(url)
+            known = None if meta is None else dict(meta)
+
+        fetched = None
+        if known is None:
+            fetched = self._fetch(url, None)
+        elif time.time() - known.get("checked_at", 0) > self.revalidate_after:
+            try:
+                fetched = self._fetch(url, known)
+            except Exception as e:
+                print(f"Cover revalidation failed, using cached copy: {e}")
+            known["checked_at"] = time.time()
+
+        with self._lock:
+            if known is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            if fetched is not None:
+                meta = self._store(url, *fetched)
+                return self._serve(url, meta, cover_size, stored=True, changed=True)
+
+            meta = self._cached_meta(url)
+            if meta is not None:
+                changed = meta.get("checked_at", 0) < known["checked_at"]
+                if changed:
+                    meta["checked_at"] = known["checked_at"]
+                return self._serve(url, meta, cover_size, stored=False, changed=changed)
+
+        return self.get(url, cover_size)
+
+    def _publish(self) -> None:
+        update_metrics("cover_cache", {
+            "entries": len(self._index),
+            "hits": self.hits,
+            "misses": self.misses,
+            "downloads": self.downloads,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+        })
+
+
+_cache: Optional[CoverCache] = None
+
+
+def get_cover_cache() -> Optional[CoverCache]:
+    global _cache
+
+    cache_cfg = read_config()["image"].get("cover_cache", {})
+    if not cache_cfg.get("enabled", True):
+        return None
+
+    max_bytes = int(float(cache_cfg.get("max_mb", 20)) * 1024 * 1024)
+    revalidate_after = float(cache_cfg.get("revalidate_hours", 168)) * 3600.0
+    if _cache is None:
+        _cache = CoverCache(COVER_CACHE_DIR, max_bytes, revalidate_after)
+    else:
+        _cache.max_bytes = max_bytes
+        _cache.revalidate_after = revalidate_after
+    return _cache
+
+
+def load_cover(url: str) -> Image.Image:
+    cache = get_cover_cache()
+    cover_size = int(read_config()["image"]["cover_size"])
+    if cache is None or not url.startswith(("http://", "https://")):
+        return load_image(url, min_size=max(cover_size, SAMPLE_SIZE))
+    return cache.get(url, cover_size)
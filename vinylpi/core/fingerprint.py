@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from vinylpi.core.audio_gate import to_mono_float
+
+_FRAME_SIZE = 4096
+_HOP_SIZE = 2048
+_CHROMA_RANGE_HZ = (55.0, 2000.0)
+_TIMBRE_RANGE_HZ = (60.0, 8000.0)
+_TIMBRE_BANDS = 16
+
+_mapping_cache: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    chroma: np.ndarray
+    timbre: np.ndarray
+
+
+def _mappings(sample_rate: int) -> tuple[np.ndarray, np.ndarray]:
+    cached = _mapping_cache.get(sample_rate)
+    if cached is not None:
+        return cached
+
+    freqs = np.fft.rfftfreq(_FRAME_SIZE, d=1.0 / sample_rate)
+
+    chroma_map = np.zeros((len(freqs), 12), dtype=np.float32)
+    in_range = (freqs >= _CHROMA_RANGE_HZ[0]) & (freqs <= _CHROMA_RANGE_HZ[1])
+    pitch = np.round(12.0 * np.log2(freqs[in_range] / 440.0)).astype(int) % 12
+    chroma_map[np.nonzero(in_range)[0], pitch] = 1.0
+
+    edges = np.geomspace(_TIMBRE_RANGE_HZ[0], _TIMBRE_RANGE_HZ[1], _TIMBRE_BANDS + 1)
+    band = np.digitize(freqs, edges) - 1
+    timbre_map = np.zeros((len(freqs), _TIMBRE_BANDS), dtype=np.float32)
+    valid = (band >= 0) & (band < _TIMBRE_BANDS)
+    timbre_map[np.nonzero(valid)[0], band[valid]] = 1.0
+
+    _mapping_cache[sample_rate] = (chroma_map, timbre_map)
+    return chroma_map, timbre_map
+
+
+def _unit(v: np.ndarray) -> np.ndarray:
+    norm = float(np.linalg.norm(v))
+    return v / norm if norm > 0 else v
+
+
+def _centered_log(v: np.ndarray, floor: float) -> np.ndarray:
+    log_v = np.log(v + floor)
+    return _unit(log_v - log_v.mean())
+
+
+def power_spectrogram(x: np.ndarray) -> np.ndarray:
+    if len(x) < _FRAME_SIZE:
+        x = np.pad(x, (0, _FRAME_SIZE - len(x)))
+
+    n_frames = 1 + (len(x) - _FRAME_SIZE) // _HOP_SIZE
+    idx = np.arange(_FRAME_SIZE)[None, :] + _HOP_SIZE * np.arange(n_frames)[:, None]
+    frames = x[idx] * np.hanning(_FRAME_SIZE).astype(np.float32)
+    return np.square(np.abs(np.fft.rfft(frames, axis=1)))
+
+
+def compute_fingerprint(audio: np.ndarray, sample_rate: int) -> Fingerprint:
+    power = power_spectrogram(to_mono_float(audio))
+    chroma_map, timbre_map = _mappings(sample_rate)
+
+    chroma_frames = power @ chroma_map
+    chroma_frames /= chroma_frames.sum(axis=1, keepdims=True) + 1e-12
+    chroma = _centered_log(chroma_frames.mean(axis=0), 1e-3)
+
+    timbre = _centered_log((power @ timbre_map).mean(axis=0), 1e-10)
+
+    return Fingerprint(chroma=chroma, timbre=timbre)
+
+
+def similarity(a: Fingerprint, b: Fingerprint) -> float:
+    chroma_sim = float(np.dot(a.chroma, b.chroma))
+    timbre_sim = float(np.dot(a.timbre, b.timbre))
+    return 0.5 * chroma_sim + 0.5 * timbre_sim
+
+
+_PEAK_BANDS_HZ = (300.0, 600.0, 1200.0, 2400.0, 4800.0)
+_PEAK_MIN_PROMINENCE = 2.0
+_FREQ_QUANT_HZ = 20.0
+_FAN_OUT_FRAMES = 4
+_MAX_TARGETS = 3
+
+
+def compute_landmarks(audio: np.ndarray, sample_rate: int) -> tuple[np.ndarray, np.ndarray]:
+    power = power_spectrogram(to_mono_float(audio))
+    log_power = np.log(power + 1e-10)
+    freqs = np.fft.rfftfreq(_FRAME_SIZE, d=1.0 / sample_rate)
+    frame_floor = np.median(log_power, axis=1)
+
+    peak_t = []
+    peak_f = []
+    for lo, hi in zip(_PEAK_BANDS_HZ[:-1], _PEAK_BANDS_HZ[1:]):
+        band = np.nonzero((freqs >= lo) & (freqs < hi))[0]
+        if len(band) == 0:
+            continue
+        local = np.argmax(log_power[:, band], axis=1)
+        strength = log_power[np.arange(len(local)), band[local]]
+        keep = strength > frame_floor + _PEAK_MIN_PROMINENCE
+        peak_t.append(np.nonzero(keep)[0])
+        peak_f.append(np.round(freqs[band[local[keep]]] / _FREQ_QUANT_HZ).astype(np.int64))
+
+    if not peak_t:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.int32)
+
+    t = np.concatenate(peak_t)
+    f = np.concatenate(peak_f)
+    order = np.lexsort((f, t))
+    t, f = t[order], f[order]
+
+    dt = t[None, :] - t[:, None]
+    pairs = (dt >= 1) & (dt <= _FAN_OUT_FRAMES) & (f[None, :] != f[:, None])
+    pairs &= np.cumsum(pairs, axis=1) <= _MAX_TARGETS
+    anchor, target = np.nonzero(pairs)
+
+    hashes = ((f[anchor] & 0x3FF) << 22) | ((f[target] & 0x3FF) << 12) | (dt[anchor, target] & 0xFFF)
+    keys = np.unique((hashes.astype(np.uint64) << np.uint64(32)) | t[anchor].astype(np.uint64))
+    return (keys >> np.uint64(32)).astype(np.uint32), (keys & np.uint64(0xFFFFFFFF)).astype(np.int32)
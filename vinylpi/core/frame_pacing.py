@@ -0,0 +1,73 @@
+import math
+import threading
+import time
+from typing import Optional
+
+from vinylpi.core.metrics import update_metrics
+
+_RTT_ALPHA = 0.2
+_RATE_ALPHA = 0.1
+_RTT_HEADROOM = 1.15
+_PUBLISH_INTERVAL_SECONDS = 1.0
+
+
+class FramePacer:
+    def __init__(self, min_interval: float, max_interval: float = 1.0):
+        self.min_interval = max(min_interval, 0.001)
+        self.max_interval = max(max_interval, self.min_interval)
+        self.interval = self.min_interval
+
+        self.rtt: Optional[float] = None
+        self.fps: Optional[float] = None
+        self.jitter = 0.0
+        self.frames = 0
+        self.dropped = 0
+
+        self._deadline: Optional[float] = None
+        self._last_start: Optional[float] = None
+        self._last_publish = 0.0
+
+    def frame_start(self) -> float:
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now
+
+        if self._last_start is not None:
+            actual = now - self._last_start
+            if actual > 0:
+                rate = 1.0 / actual
+                self.fps = rate if self.fps is None else self.fps + _RATE_ALPHA * (rate - self.fps)
+                self.jitter += _RATE_ALPHA * (abs(actual - self.interval) - self.jitter)
+        self._last_start = now
+        self.frames += 1
+        return now
+
+    def record_send(self, rtt: float) -> None:
+        self.rtt = rtt if self.rtt is None else self.rtt + _RTT_ALPHA * (rtt - self.rtt)
+        sustainable = self.rtt * _RTT_HEADROOM
+        self.interval = min(self.max_interval, max(self.min_interval, sustainable))
+
+    def wait(self, stop_event: threading.Event) -> bool:
+        now = time.monotonic()
+        next_deadline = self._deadline + self.interval
+        if next_deadline < now:
+            missed = math.ceil((now - next_deadline) / self.interval)
+            self.dropped += missed
+            next_deadline += missed * self.interval
+        self._deadline = next_deadline
+
+        self._maybe_publish(now)
+        return stop_event.wait(max(0.0, next_deadline - now))
+
+    def _maybe_publish(self, now: float) -> None:
+        if now - self._last_publish < _PUBLISH_INTERVAL_SECONDS:
+            return
+        self._last_publish = now
+        update_metrics("frame_pacing", {
+            "fps": round(self.fps, 2) if self.fps is not None else None,
+            "target_fps": round(1.0 / self.interval, 2),
+            "rtt_ms": round(self.rtt * 1000, 1) if self.rtt is not None else None,
+            "jitter_ms": round(self.jitter * 1000, 1),
+            "frames": self.frames,
+            "dropped": self.dropped,
+        })
@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from vinylpi.web.services.config import read_config
+from vinylpi.core.metrics import update_metrics
+
+_WINDOW_SECONDS = 60.0
+
+
+class RequestBudget:
+    def __init__(self, max_per_minute: int):
+        self.max_per_minute = max_per_minute
+        self.limited = 0
+        self._sent: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, wanted: int) -> int:
+        with self._lock:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0] >= _WINDOW_SECONDS:
+                self._sent.popleft()
+
+            if self.max_per_minute > 0:
+                available = self.max_per_minute - len(self._sent)
+                granted = max(1, min(wanted, available))
+            else:
+                granted = wanted
+
+            if granted < wanted:
+                self.limited += 1
+            self._sent.extend([now] * granted)
+
+            update_metrics("hedging", {
+                "requests_last_minute": len(self._sent),
+                "budget_limited": self.limited,
+            })
+            return granted
+
+
+_budget: Optional[RequestBudget] = None
+
+
+def hedge_settings(cfg: dict) -> tuple[int, float]:
+    hedge_cfg = cfg.get("recognition", {}).get("hedging", {})
+    if not hedge_cfg.get("enabled", False):
+        return 1, 0.0
+    concurrency = max(1, int(hedge_cfg.get("concurrency", 2)))
+    offset_seconds = max(0.0, float(hedge_cfg.get("offset_seconds", 3)))
+    if offset_seconds <= 0:
+        return 1, 0.0
+    return concurrency, offset_seconds
+
+
+def split_offset_windows(
+    span: np.ndarray,
+    sample_rate: int,
+    window_seconds: float,
+    count: int,
+    offset_seconds: float,
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    n = min(int(window_seconds * sample_rate), len(span))
+    step = int(offset_seconds * sample_rate)
+    end = len(span)
+
+    primary = span[end - n:]
+    alternates = []
+    for k in range(1, count):
+        stop = end - k * step
+        if step <= 0 or stop - n < 0:
+            break
+        alternates.append(span[stop - n:stop])
+    return primary, alternates
+
+
+def get_request_budget() -> RequestBudget:
+    global _budget
+
+    hedge_cfg = read_config().get("recognition", {}).get("hedging", {})
+    max_per_minute = int(hedge_cfg.get("max_requests_per_minute", 12))
+    if _budget is None:
+        _budget = RequestBudget(max_per_minute)
+    else:
+        _budget.max_per_minute = max_per_minute
+    return _budget
@@ -1,26 +1,29 @@
 from io import BytesIO
-from collections import Counter
-import colorsys
+import weakref
 
 import requests
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
 from vinylpi.web.services.config import read_config
+from vinylpi.core.artwork import analyze_artwork
 
-def load_image(path_or_url: str) -> Image.Image:
+def load_image(path_or_url: str, min_size: int | None = None) -> Image.Image:
     if not path_or_url:
         raise ValueError("load_image: path_or_url is None or empty")
 
     if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
         resp = requests.get(path_or_url, timeout=15)
         resp.raise_for_status()
-        img = Image.open(BytesIO(resp.content))
+        source = BytesIO(resp.content)
     else:
-        img = Image.open(path_or_url)
+        source = path_or_url
 
-    img = ImageOps.exif_transpose(img)
+    with Image.open(source) as img:
+        if min_size and img.format == "JPEG":
+            img.draft("RGB", (min_size, min_size))
 
-    return img.convert("RGB")
+        img = ImageOps.exif_transpose(img)
+        return img.convert("RGB")
 
 
 
@@ -29,20 +32,91 @@ def relative_luminance(rgb):
     return 0.2126 * r + 0.7152 * g + 0.0722 * b
 
 
+class FontMetrics:
+    def __init__(self, font: ImageFont.FreeTypeFont):
+        self.font = font
+        self.arithmetic = (
+            isinstance(font, ImageFont.FreeTypeFont)
+            and font.layout_engine == ImageFont.Layout.BASIC
+        )
+        self._glyphs: dict[str, tuple[float, int, int, int, int]] = {}
+
+    def _glyph(self, ch: str) -> tuple[float, int, int, int, int]:
+        glyph = self._glyphs.get(ch)
+        if glyph is None:
+            left, top, right, bottom = self.font.getbbox(ch)
+            glyph = (self.font.getlength(ch), left, top, right, bottom)
+            self._glyphs[ch] = glyph
+        return glyph
+
+    def bbox(self, text: str) -> tuple[int, int, int, int]:
+        if not self.arithmetic:
+            return _measure_draw.textbbox((0, 0), text, font=self.font)
+
+        pen = 0.0
+        left = top = float("inf")
+        right = bottom = float("-inf")
+        for ch in text:
+            advance, gl, gt, gr, gb = self._glyph(ch)
+            if gr > gl or gb > gt:
+                left = min(left, pen + gl)
+                right = max(right, pen + gr)
+                top = min(top, gt)
+                bottom = max(bottom, gb)
+            pen += advance
+
+        if left > right:
+            return 0, 0, 0, 0
+        return int(left), int(top), int(right), int(bottom)
+
+
+_measure_draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+_metrics_cache: "weakref.WeakKeyDictionary[ImageFont.FreeTypeFont, FontMetrics]" = weakref.WeakKeyDictionary()
+
+
+def font_metrics(font: ImageFont.FreeTypeFont) -> FontMetrics:
+    metrics = _metrics_cache.get(font)
+    if metrics is None:
+        metrics = FontMetrics(font)
+        _metrics_cache[font] = metrics
+    return metrics
+
+
 def text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int]:
-    dummy = Image.new("RGB", (1, 1))
-    d = ImageDraw.Draw(dummy)
-    bbox = d.textbbox((0, 0), text, font=font)
-    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+    left, top, right, bottom = font_metrics(font).bbox(text)
+    return right - left, bottom - top
+
+
+def render_text_strip(text: str, font: ImageFont.FreeTypeFont) -> tuple[Image.Image, int, int]:
+    left, top, right, bottom = font.getbbox(text)
+    dx = min(left, 0)
+    dy = min(top, 0)
+
+    strip = Image.new("L", (max(1, right - dx), max(1, bottom - dy)), 0)
+    ImageDraw.Draw(strip).text((-dx, -dy), text, font=font, fill=255)
+    return strip, dx, dy
+
+
+def blit_strip(
+    frame: Image.Image,
+    strip: Image.Image,
+    x: int,
+    y: int,
+    color: tuple[int, int, int],
+) -> None:
+    left = max(0, -x)
+    right = min(strip.width, frame.width - x)
+    if right <= left:
+        return
+    frame.paste(color, (x + left, y), strip.crop((left, 0, right, strip.height)))
 
 
 _font_cache: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
 
 
-def _load_font(size: int) -> ImageFont.FreeTypeFont:
-    CONFIG = read_config()
-    img_cfg = CONFIG["image"]
-    font_path = img_cfg["font_path"]
+def _load_font(size: int, font_path: str | None = None) -> ImageFont.FreeTypeFont:
+    if font_path is None:
+        font_path = read_config()["image"]["font_path"]
     cache_key = (font_path, size)
 
     if cache_key in _font_cache:
@@ -58,28 +132,36 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont:
     return font
 
 def _measure_text_height(font: ImageFont.FreeTypeFont, text: str = "A") -> int:
-    dummy = Image.new("RGB", (1, 1))
-    d = ImageDraw.Draw(dummy)
-    bbox = d.textbbox((0, 0), text, font=font)
-    return bbox[3] - bbox[1]
+    return text_size(text, font)[1]
+
+
+_resolved_fonts: dict[tuple[str, int], tuple[ImageFont.FreeTypeFont, int]] = {}
+
 
 def _get_font_for_config() -> tuple[ImageFont.FreeTypeFont, int]:
     CONFIG = read_config()
     img_cfg = CONFIG["image"]
+    font_path = img_cfg["font_path"]
     TARGET_GLYPH_HEIGHT = img_cfg["font_size"]
 
-    best_font = _load_font(5)
+    cache_key = (font_path, TARGET_GLYPH_HEIGHT)
+    if cache_key in _resolved_fonts:
+        return _resolved_fonts[cache_key]
+
+    best_font = _load_font(5, font_path)
     best_h = _measure_text_height(best_font)
 
     for size in range(1, 25):
-        f = _load_font(size)
+        f = _load_font(size, font_path)
         h_test = _measure_text_height(f)
         if h_test == TARGET_GLYPH_HEIGHT:
-            return f, h_test
+            best_font, best_h = f, h_test
+            break
         if abs(h_test - TARGET_GLYPH_HEIGHT) < abs(best_h - TARGET_GLYPH_HEIGHT):
             best_font = f
             best_h = h_test
 
+    _resolved_fonts[cache_key] = (best_font, best_h)
     return best_font, best_h
 
 def dynamic_text_color(bg_rgb: tuple[int, int, int]) -> tuple[int, int, int]:
@@ -90,150 +172,5 @@ def dynamic_text_color(bg_rgb: tuple[int, int, int]) -> tuple[int, int, int]:
     return (0, 0, 0) if lum > lum_threhsold else (255, 255, 255)
 
 
-def dynamic_bg_color(cover_img: Image.Image, num_colors: int = 8) -> tuple[int, int, int]:
-    small = cover_img.resize((64, 64), Image.Resampling.BILINEAR)
-
-    pal_img = small.convert("P", palette=Image.ADAPTIVE, colors=num_colors)
-    palette = pal_img.getpalette()
-    color_counts = pal_img.getcolors()
-
-    if not color_counts:
-        return (40, 40, 40)
-
-    color_counts.sort(reverse=True, key=lambda x: x[0])
-
-    candidates = []
-    for rank, (count, idx) in enumerate(color_counts):
-        r = palette[3 * idx + 0]
-        g = palette[3 * idx + 1]
-        b = palette[3 * idx + 2]
-
-        h, s, v = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
-        lum = relative_luminance((r, g, b))
-
-        if s < 0.25:
-            continue
-        if lum < 30 or lum > 230:
-            continue
-
-        score = count
-        if rank == 0:
-            score *= 0.7
-
-        candidates.append((score, (r, g, b)))
-
-    if not candidates:
-        _, idx = color_counts[0]
-        r = palette[3 * idx + 0]
-        g = palette[3 * idx + 1]
-        b = palette[3 * idx + 2]
-        base = (r, g, b)
-    else:
-        _, base = max(candidates, key=lambda x: x[0])
-
-    r, g, b = base
-    lum = relative_luminance((r, g, b))
-    target_min, target_max = 60, 180
-
-    if lum < target_min:
-        factor = target_min / max(lum, 1)
-        r = min(int(r * factor), 255)
-        g = min(int(g * factor), 255)
-        b = min(int(b * factor), 255)
-    elif lum > target_max:
-        factor = target_max / lum
-        r = int(r * factor)
-        g = int(g * factor)
-        b = int(b * factor)
-
-    return (r, g, b)
-
-def build_static_frame(
-    cover_img: Image.Image,
-    artist: str,
-    title: str,
-    tick: int = 0,
-    bg_color: tuple[int, int, int] | None = None,
-) -> Image.Image:
-    CONFIG = read_config()
-    img_cfg = CONFIG["image"]
-
-    CANVAS_SIZE = img_cfg["canvas_size"]
-    COVER_SIZE = img_cfg["cover_size"]
-    TOP_MARGIN = img_cfg["top_margin"]
-    GAP_BETWEEN_COVER_AND_BAND = img_cfg["margin_image_text"]
-    GAP_BETWEEN_LINES = img_cfg["line_spacing_margin"]
-    USE_DYNAMIC_BG = img_cfg.get("use_dynamic_bg", True)
-
-    USE_DYNAMIC_BG = img_cfg.get("use_dynamic_bg", True)
-    USE_DYNAMIC_TEXT = img_cfg.get("use_dynamic_text_color", False)
-
-    if bg_color is None:
-        if USE_DYNAMIC_BG:
-            bg_color = dynamic_bg_color(cover_img)
-        else:
-            bg_color = tuple(img_cfg["manual_bg_color"])
-
-    if USE_DYNAMIC_TEXT:
-        TEXT_COLOR = dynamic_text_color(bg_color)
-    else:
-        TEXT_COLOR = tuple(img_cfg["text_color"])
-
-
-    canvas = Image.new("RGB", (CANVAS_SIZE, CANVAS_SIZE), bg_color)
-
-    w, h = cover_img.size
-    side = min(w, h)
-    left = (w - side) // 2
-    top = (h - side) // 2
-    cover_square = cover_img.crop((left, top, left + side, top + side))
-    cover_resized = cover_square.resize((COVER_SIZE, COVER_SIZE), Image.Resampling.BILINEAR)
-
-    x_cover = (CANVAS_SIZE - COVER_SIZE) // 2
-    y_cover = TOP_MARGIN
-    canvas.paste(cover_resized, (x_cover, y_cover))
-
-    font, glyph_h = _get_font_for_config()
-
-    if img_cfg.get("uppercase", False):
-        artist = artist.upper()
-        title = title.upper()
-    w1, _ = text_size(artist, font)
-    w2, _ = text_size(title, font)
-
-    draw = ImageDraw.Draw(canvas)
-
-    y_band = TOP_MARGIN + COVER_SIZE + GAP_BETWEEN_COVER_AND_BAND
-    y_title = y_band + glyph_h + GAP_BETWEEN_LINES
-
-    both_scroll = (w1 > CANVAS_SIZE) and (w2 > CANVAS_SIZE)
-    if both_scroll:
-        sync_range = max(w1, w2) + CANVAS_SIZE
-
-    CENTER_SPACING_CORR = 1
-
-    def compute_x(w_text: int, tick_val: int) -> int:
-        if w_text <= CANVAS_SIZE:
-            if w_text < CANVAS_SIZE and CENTER_SPACING_CORR > 0:
-                effective_w = max(0, w_text - CENTER_SPACING_CORR)
-            else:
-                effective_w = w_text
-
-            return (CANVAS_SIZE - effective_w) // 2
-
-        if both_scroll:
-            scroll_range = sync_range
-        else:
-            scroll_range = w_text + CANVAS_SIZE
-
-        offset = tick_val % scroll_range
-        return CANVAS_SIZE - offset
-
-
-    x_band = compute_x(w1, tick)
-    x_title = compute_x(w2, tick)
-
-    draw.text((x_band, y_band), artist, font=font, fill=TEXT_COLOR)
-    draw.text((x_title, y_title), title, font=font, fill=TEXT_COLOR)
-
-    return canvas
\ No newline at end of file
+def dynamic_bg_color(cover_img: Image.Image, cover_url: str | None = None) -> tuple[int, int, int]:
+    return analyze_artwork(cover_img, cover_url).bg_color
@@ -1,7 +1,9 @@
 from vinylpi.core.recognition import start_scrolling_display, show_fallback_image
 from vinylpi.core.title_variants import canonicalize_title, variant_score
 from vinylpi.core.status import write_status
-from vinylpi.core.image_utils import dynamic_bg_color
+from vinylpi.core.artwork import analyze_artwork
+from vinylpi.core.fingerprint import Fingerprint, similarity
+from vinylpi.core.metrics import update_metrics
 from vinylpi.web.routes.ha_api import send_rgb_to_ha
 from vinylpi.core.statistics import (
     _update_stats,
@@ -9,7 +11,7 @@ from vinylpi.core.statistics import (
     add_listen_time_minutes_for_confirmed_song,
 )
 
-from vinylpi.core.loop_state import LoopConfig, DisplayState, AlbumState, StatsSwitchState
+from vinylpi.core.loop_state import LoopConfig, DisplayState, AlbumState, StatsSwitchState, TrackLockState
 
 
 def log_pixoo_update_reason(*, debug_log: bool, last_display_was_fallback: bool, cfg_reloaded: bool, is_same_song: bool) -> None:
@@ -28,13 +30,19 @@ def log_pixoo_update_reason(*, debug_log: bool, last_display_was_fallback: bool,
         print("New song detected, updating Pixoo.")
 
 
-def handle_no_result(cfg: LoopConfig, disp: DisplayState, cfg_reloaded: bool) -> bool:
-    disp.consecutive_failures += 1
+def handle_no_result(cfg: LoopConfig, disp: DisplayState, cfg_reloaded: bool, gated: bool = False) -> bool:
+    if gated:
+        disp.consecutive_gated += 1
+    else:
+        disp.consecutive_failures += 1
     if cfg.debug_log:
-        print(f"No song detected for (#{disp.consecutive_failures} times in a row).")
+        print(
+            f"No song detected for (#{disp.consecutive_failures + disp.consecutive_gated} times in a row, "
+            f"{disp.consecutive_gated} gated)."
+        )
 
     fallback_due = (
-        disp.consecutive_failures >= cfg.fallback_allowed_failures
+        disp.consecutive_failures + disp.consecutive_gated >= cfg.fallback_allowed_failures
         and (not disp.last_display_was_fallback or cfg_reloaded)
     )
 
@@ -74,6 +82,7 @@ def should_update_display(*, disp: DisplayState, song_id: tuple[str, str], score
 
 def handle_song_result(cfg: LoopConfig, disp: DisplayState, cfg_reloaded: bool, result):
     disp.consecutive_failures = 0
+    disp.consecutive_gated = 0
 
     artist, title, cover_img, album, cover_url = result
 
@@ -118,9 +127,9 @@ def handle_song_result(cfg: LoopConfig, disp: DisplayState, cfg_reloaded: bool,
         is_same_song=is_same_song,
     )
 
-    start_scrolling_display(cover_img, artist, canonical_title)
+    start_scrolling_display(cover_img, artist, canonical_title, cover_url)
     try:
-        rgb = dynamic_bg_color(cover_img)
+        rgb = analyze_artwork(cover_img, cover_url).bg_color
         send_rgb_to_ha(rgb)
     except Exception as e:
         if cfg.debug_log:
@@ -220,9 +229,9 @@ def update_album_session_on_switch(*, st: AlbumState, album: str | None, title:
         st.current_album_session_counted = True
 
 
-def maybe_add_listen_time(cfg: LoopConfig, did_confirm_switch: bool, artist: str, title: str, album: str | None) -> None:
+def maybe_add_listen_time(cfg: LoopConfig, did_confirm_switch: bool, artist: str, title: str, album: str | None) -> dict | None:
     if not did_confirm_switch:
-        return
+        return None
 
     res = add_listen_time_minutes_for_confirmed_song(artist, title, album)
     if cfg.debug_log:
@@ -233,3 +242,56 @@ def maybe_add_listen_time(cfg: LoopConfig, did_confirm_switch: bool, artist: str
             )
         else:
             print(f"Listen time not added: {res.get('error')}")
+
+    return res
+
+
+def _publish_track_lock_metrics(st: TrackLockState) -> None:
+    total = st.local_skips_total + st.remote_checks_total
+    update_metrics("same_track", {
+        "local_skips": st.local_skips_total,
+        "remote_checks": st.remote_checks_total,
+        "skip_ratio": round(st.local_skips_total / total, 3) if total else 0.0,
+    })
+
+
+def should_skip_recognition(cfg: LoopConfig, st: TrackLockState, fingerprint: Fingerprint | None, cfg_reloaded: bool) -> bool:
+    if not cfg.same_track_enabled or fingerprint is None or st.reference is None or cfg_reloaded:
+        st.remote_checks_total += 1
+        _publish_track_lock_metrics(st)
+        return False
+
+    score = similarity(st.reference, fingerprint)
+    skip = score >= cfg.same_track_threshold and st.skips < cfg.same_track_max_skips
+
+    if skip:
+        st.skips += 1
+        st.local_skips_total += 1
+        if cfg.debug_log:
+            print(f"Same track still playing (similarity {score:.2f}), skipping recognition.")
+    else:
+        st.remote_checks_total += 1
+        if cfg.debug_log:
+            if score < cfg.same_track_threshold:
+                print(f"Local similarity dropped to {score:.2f}, asking Shazam again.")
+            else:
+                print(f"{st.skips} local skips in a row, re-checking with Shazam.")
+
+    _publish_track_lock_metrics(st)
+    return skip
+
+
+def update_track_lock(*, st: TrackLockState, stats_st: StatsSwitchState, song_id, fingerprint: Fingerprint | None) -> None:
+    if fingerprint is not None and song_id == stats_st.current_song_id:
+        st.song_id = song_id
+        st.reference = fingerprint
+        st.skips = 0
+        return
+
+    clear_track_lock(st)
+
+
+def clear_track_lock(st: TrackLockState) -> None:
+    st.song_id = None
+    st.reference = None
+    st.skips = 0
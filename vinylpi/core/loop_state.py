@@ -1,24 +1,42 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
+from vinylpi.core.fingerprint import Fingerprint
+
 @dataclass
 class LoopConfig:
     delay: int = 10
     debug_log: bool = False
     fallback_allowed_failures: int = 3
     auto_sleep: int = 50
+    same_track_enabled: bool = True
+    same_track_threshold: float = 0.85
+    same_track_max_skips: int = 10
+    pipeline_enabled: bool = True
+    adaptive_polling: bool = True
+    max_delay: int = 20
+    boundary_window: int = 30
 
     @staticmethod
     def from_config(cfg: dict) -> "LoopConfig":
         behavior = cfg.get("behavior", {})
         debug = cfg.get("debug", {})
         fallback = cfg.get("fallback", {})
+        same_track = cfg.get("recognition", {}).get("same_track", {})
+        adaptive = behavior.get("adaptive_polling", {})
 
         return LoopConfig(
             delay=int(behavior.get("loop_delay_seconds", 10)),
             debug_log=bool(debug.get("logs", False)),
             fallback_allowed_failures=int(fallback.get("allowed_failures", 3)),
             auto_sleep=int(behavior.get("auto_sleep", 50)),
+            same_track_enabled=bool(same_track.get("enabled", True)),
+            same_track_threshold=float(same_track.get("similarity_threshold", 0.85)),
+            same_track_max_skips=int(same_track.get("max_skips", 10)),
+            pipeline_enabled=bool(behavior.get("pipeline", {}).get("enabled", True)),
+            adaptive_polling=bool(adaptive.get("enabled", True)),
+            max_delay=int(adaptive.get("max_delay_seconds", 20)),
+            boundary_window=int(adaptive.get("boundary_window_seconds", 30)),
         )
 
 @dataclass
@@ -27,6 +45,7 @@ class DisplayState:
     last_song_variant_score: Optional[int] = None
     last_display_was_fallback: bool = False
     consecutive_failures: int = 0
+    consecutive_gated: int = 0
 
 @dataclass
 class AlbumState:
@@ -41,3 +60,11 @@ class StatsSwitchState:
     current_song_id: Optional[tuple[str, str]] = None
     candidate_song_id: Optional[tuple[str, str]] = None
     candidate_streak: int = 0
+
+@dataclass
+class TrackLockState:
+    song_id: Optional[tuple[str, str]] = None
+    reference: Optional[Fingerprint] = None
+    skips: int = 0
+    local_skips_total: int = 0
+    remote_checks_total: int = 0
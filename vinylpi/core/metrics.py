@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from vinylpi.paths import METRICS_PATH
+
+_WRITE_INTERVAL_SECONDS = 1.0
+
+_metrics: dict[str, dict] = {}
+_lock = threading.Lock()
+_write_lock = threading.Lock()
+_last_write = 0.0
+_pending = False
+_trailing: Optional[threading.Timer] = None
+
+
+def update_metrics(section: str, values: dict, *, flush: bool = False) -> None:
+    global _pending, _trailing
+
+    with _lock:
+        entry = _metrics.setdefault(section, {})
+        entry.update(values)
+        entry["updated_at"] = round(time.time(), 3)
+        _pending = True
+
+        wait = _WRITE_INTERVAL_SECONDS - (time.monotonic() - _last_write)
+        if not flush and wait > 0:
+            if _trailing is None:
+                _trailing = threading.Timer(wait, flush_metrics)
+                _trailing.daemon = True
+                _trailing.start()
+            return
+
+    flush_metrics()
+
+
+def flush_metrics() -> None:
+    global _last_write, _pending, _trailing
+
+    with _write_lock:
+        with _lock:
+            if _trailing is not None:
+                _trailing.cancel()
+                _trailing = None
+            if not _pending:
+                return
+            _pending = False
+            _last_write = time.monotonic()
+            data = json.dumps(_metrics, indent=4)
+
+        try:
+            METRICS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = METRICS_PATH.with_suffix(METRICS_PATH.suffix + ".tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, METRICS_PATH)
+        except Exception as e:
+            print(f"Could not write metrics file: {e}")
@@ -0,0 +1,206 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from vinylpi.web.services.config import read_config
+from vinylpi.core.audio_capture import capture_window, pop_track_boundary
+from vinylpi.core.audio_gate import gate_window, MUSIC
+from vinylpi.core.fingerprint import Fingerprint, compute_fingerprint, compute_landmarks
+from vinylpi.core.hedging import hedge_settings, split_offset_windows
+from vinylpi.core.metrics import update_metrics
+
+
+@dataclass
+class CaptureWindow:
+    seq: int
+    audio: np.ndarray
+    sample_rate: int
+    captured_at: float
+    verdict: str
+    fingerprint: Optional[Fingerprint] = None
+    landmarks: Optional[tuple[np.ndarray, np.ndarray]] = None
+    after_boundary: bool = False
+    alternates: list[np.ndarray] = field(default_factory=list)
+
+
+_BOUNDARY_POLL_SECONDS = 0.25
+
+
+def wait_for_next_window(hop: float, interrupt: threading.Event) -> bool:
+    deadline = time.monotonic() + hop
+    while True:
+        boundary = pop_track_boundary()
+        if boundary is not None:
+            cfg = read_config()
+            if cfg["debug"]["logs"]:
+                print("Track boundary detected, recognizing as soon as the next window is full.")
+            ready_at = boundary + float(cfg["audio"]["sample_seconds"])
+            delay = ready_at - time.monotonic()
+            if delay > 0:
+                interrupt.wait(delay)
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if interrupt.wait(min(remaining, _BOUNDARY_POLL_SECONDS)):
+            return False
+
+
+def build_window(seq: int = 0, after_boundary: bool = False) -> Optional[CaptureWindow]:
+    cfg = read_config()
+    rec_cfg = cfg.get("recognition", {})
+    same_track_enabled = rec_cfg.get("same_track", {}).get("enabled", True)
+    cache_enabled = rec_cfg.get("cache", {}).get("enabled", True)
+    window_seconds = float(cfg["audio"]["sample_seconds"])
+
+    hedge_count, hedge_offset = hedge_settings(cfg)
+    if after_boundary:
+        hedge_count = 1
+    extra_seconds = (hedge_count - 1) * hedge_offset
+
+    captured = capture_window(extra_seconds)
+    if captured is None:
+        return None
+
+    span, sample_rate = captured
+    captured_at = time.monotonic()
+    audio, alternates = split_offset_windows(span, sample_rate, window_seconds, hedge_count, hedge_offset)
+    verdict = gate_window(audio, sample_rate)
+
+    fingerprint = None
+    landmarks = None
+    if verdict == MUSIC:
+        if same_track_enabled:
+            fingerprint = compute_fingerprint(audio, sample_rate)
+        if cache_enabled:
+            landmarks = compute_landmarks(audio, sample_rate)
+    else:
+        alternates = []
+
+    return CaptureWindow(
+        seq=seq,
+        audio=audio,
+        sample_rate=sample_rate,
+        captured_at=captured_at,
+        verdict=verdict,
+        fingerprint=fingerprint,
+        landmarks=landmarks,
+        after_boundary=after_boundary,
+        alternates=alternates,
+    )
+
+
+class CapturePipeline:
+    def __init__(self, queue_size: int = 2, max_window_age: float = 5.0, hop_seconds: float = 1.0):
+        self.max_window_age = max_window_age
+        self.hop_seconds = hop_seconds
+        self._queue: queue.Queue[CaptureWindow] = queue.Queue(maxsize=max(1, queue_size))
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.produced = 0
+        self.consumed = 0
+        self.dropped_full = 0
+        self.dropped_stale = 0
+
+    @staticmethod
+    def from_config(cfg: dict) -> "CapturePipeline":
+        behavior = cfg.get("behavior", {})
+        pipe_cfg = behavior.get("pipeline", {})
+        return CapturePipeline(
+            queue_size=int(pipe_cfg.get("queue_size", 2)),
+            max_window_age=float(pipe_cfg.get("max_window_age_seconds", 5)),
+            hop_seconds=float(behavior.get("loop_delay_seconds", 1)),
+        )
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def set_hop(self, seconds: float) -> None:
+        shorter = seconds < self.hop_seconds
+        self.hop_seconds = seconds
+        if shorter:
+            self._wake_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        seq = 0
+        after_boundary = False
+        while not self._stop_event.is_set():
+            try:
+                window = build_window(seq, after_boundary)
+            except Exception as e:
+                print(f"Error while capturing window: {e}")
+                window = None
+
+            if window is None:
+                self._stop_event.wait(5)
+                continue
+
+            seq += 1
+            self._put(window)
+            self._publish()
+
+            after_boundary = wait_for_next_window(self.hop_seconds, self._wake_event)
+            self._wake_event.clear()
+
+    def _put(self, window: CaptureWindow) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(window)
+                self.produced += 1
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped_full += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float = 10.0) -> Optional[CaptureWindow]:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            try:
+                window = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return None
+
+            age = time.monotonic() - window.captured_at
+            if age > self.max_window_age:
+                self.dropped_stale += 1
+                continue
+
+            self.consumed += 1
+            update_metrics("pipeline", {"last_window_age_s": round(age, 3)})
+            self._publish()
+            return window
+
+    def _publish(self) -> None:
+        update_metrics("pipeline", {
+            "produced": self.produced,
+            "consumed": self.consumed,
+            "dropped_full": self.dropped_full,
+            "dropped_stale": self.dropped_stale,
+            "queued": self._queue.qsize(),
+        })
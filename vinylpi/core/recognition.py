@@ -1,34 +1,38 @@
 import asyncio
+import hashlib
 import threading
 import time
 from typing import Optional, Tuple
 
-from shazamio import Shazam
-
 from vinylpi.web.services.config import read_config
-
+from vinylpi.core.recognition_service import get_recognition_service
+from vinylpi.core.recognition_cache import get_recognition_cache
+from vinylpi.core.audio_capture import encode_for_recognition
+from vinylpi.core.fingerprint import compute_landmarks
+from vinylpi.core.hedging import get_request_budget, hedge_settings
+from vinylpi.core.metrics import update_metrics
+
+from vinylpi.core.cover_cache import load_cover, square_cover
+from vinylpi.core.render_cache import layer
+from vinylpi.core.frame_pacing import FramePacer
+from vinylpi.core.artwork import analyze_artwork
 from vinylpi.core.image_utils import (
-    load_image,
-    dynamic_bg_color,
     _get_font_for_config,
     text_size,
     dynamic_text_color,
+    render_text_strip,
+    blit_strip,
 )
 from vinylpi.integrations.divoom_api import PixooClient, PixooError
-from PIL import Image, ImageDraw
+from vinylpi.integrations.recognizer_backends import create_backend
+import numpy as np
+from PIL import Image
 
 _scroll_thread: Optional[threading.Thread] = None
 _scroll_stop_event = threading.Event()
 
-_shazam: Optional[Shazam] = None
 _pixoo_client: Optional[PixooClient] = None
-
-
-def _get_shazam() -> Shazam:
-    global _shazam
-    if _shazam is None:
-        _shazam = Shazam()
-    return _shazam
+_device_text_active = False
 
 
 def _get_pixoo() -> PixooClient:
@@ -51,14 +55,12 @@ def _stop_scroll_thread():
 async def _recognize_async(wav_bytes: bytes):
     CONFIG = read_config()
     debug_log = CONFIG["debug"]["logs"]
-    if debug_log:
-        print("Starting Shazam-recognition ...")
 
-    shazam = _get_shazam()
+    backend = create_backend(CONFIG)
+    if debug_log:
+        print(f"Starting {backend.name}-recognition ...")
 
-    shazam_cfg = CONFIG.get("shazam", {})
-    timeout_s = shazam_cfg.get("timeout_seconds", 15)
-    result = await asyncio.wait_for(shazam.recognize(wav_bytes), timeout=timeout_s)
+    result = await backend.recognize(wav_bytes)
 
     track = result.get("track") or {}
     title = track.get("title") or "UNKNOWN"
@@ -87,20 +89,133 @@ async def _recognize_async(wav_bytes: bytes):
             print("No cover image found in Shazam response.")
         return None
 
-    cover_img = load_image(cover_url)
+    cover_img = await asyncio.to_thread(load_cover, cover_url)
+    return (artist, title, cover_img, album, cover_url), _match_offset(result)
+
+
+def _match_offset(result: dict) -> Optional[float]:
+    matches = result.get("matches") or []
+    if not matches:
+        return None
+    try:
+        return float(matches[0]["offset"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+_hedge_stats = {"rounds": 0, "wins_primary": 0, "wins_offset": 0, "cancelled": 0}
+
+
+async def _recognize_first(payloads: list[bytes]):
+    if len(payloads) == 1:
+        matched = await _recognize_async(payloads[0])
+        return None if matched is None else (0, *matched)
+
+    async def attempt(idx: int, wav_bytes: bytes):
+        try:
+            return idx, await _recognize_async(wav_bytes)
+        except Exception as e:
+            print(f"Error while detecting (window {idx}): {e}")
+            return idx, None
+
+    tasks = [asyncio.create_task(attempt(i, p)) for i, p in enumerate(payloads)]
+    _hedge_stats["rounds"] += 1
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            idx, result = await next_done
+            if result is None:
+                continue
+
+            _hedge_stats["wins_primary" if idx == 0 else "wins_offset"] += 1
+            if read_config()["debug"]["logs"]:
+                print(f"Hedged recognition: window {idx} of {len(payloads)} matched first.")
+            return (idx, *result)
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+                _hedge_stats["cancelled"] += 1
+        update_metrics("hedging", dict(_hedge_stats))
+
+
+def _recognize_cached(landmarks) -> Optional[Tuple[str, str, Image.Image, str | None, str | None]]:
+    cache = get_recognition_cache()
+    if cache is None:
+        return None
+
+    cached = cache.lookup(*landmarks)
+    if cached is None:
+        return None
+
+    artist, title, album, cover_url = cached
+    if read_config()["debug"]["logs"]:
+        print(f"Recognition cache hit: {artist} – {title}")
+
+    try:
+        cover_img = load_cover(cover_url)
+    except Exception as e:
+        print(f"Could not load cached cover, asking Shazam: {e}")
+        return None
+
     return artist, title, cover_img, album, cover_url
 
 
-def recognize_song(wav_bytes: bytes,) -> Optional[Tuple[str, str, Image.Image, str | None, str | None]]:
+_last_match_offset: Optional[float] = None
+
+
+def last_match_offset() -> Optional[float]:
+    return _last_match_offset
+
+
+def recognize_song(
+    audio: np.ndarray,
+    sample_rate: int,
+    landmarks=None,
+    alternates=None,
+) -> Optional[Tuple[str, str, Image.Image, str | None, str | None]]:
+    global _last_match_offset
+    _last_match_offset = None
+
+    if landmarks is not None:
+        cached = _recognize_cached(landmarks)
+        if cached is not None:
+            return cached
+
+    payloads = [encode_for_recognition(audio, sample_rate)]
+    alternates = alternates or []
+    hedge_count, hedge_offset = hedge_settings(read_config())
+    if hedge_count > 1:
+        granted = get_request_budget().acquire(1 + len(alternates))
+        for alternate in alternates[:granted - 1]:
+            payloads.append(encode_for_recognition(alternate, sample_rate, save_debug=False))
+
     try:
-        return asyncio.run(_recognize_async(wav_bytes))
+        matched = get_recognition_service().run(_recognize_first(payloads))
     except Exception as e:
         print(f"Error while detecting: {e}")
         return None
 
+    if matched is None:
+        return None
+
+    idx, result, offset = matched
+    if offset is not None:
+        _last_match_offset = offset + idx * hedge_offset
 
+    if landmarks is not None:
+        if idx > 0:
+            landmarks = compute_landmarks(alternates[idx - 1], sample_rate)
+        artist, title, _, album, cover_url = result
+        cache = get_recognition_cache()
+        if cache is not None and not (artist == "UNKNOWN" and title == "UNKNOWN"):
+            cache.store(*landmarks, (artist, title, album, cover_url))
 
-def _prepare_base_canvas(cover_img: Image.Image, bg_color) -> Image.Image:
+    return result
+
+
+
+def _prepare_base_canvas(cover_square: Image.Image, bg_color) -> Image.Image:
     CONFIG = read_config()
     img_cfg = CONFIG["image"]
     CANVAS_SIZE = img_cfg["canvas_size"]
@@ -109,20 +224,48 @@ def _prepare_base_canvas(cover_img: Image.Image, bg_color) -> Image.Image:
 
     canvas = Image.new("RGB", (CANVAS_SIZE, CANVAS_SIZE), bg_color)
 
-    w, h = cover_img.size
-    side = min(w, h)
-    left = (w - side) // 2
-    top = (h - side) // 2
-    cover_square = cover_img.crop((left, top, left + side, top + side))
-    cover_resized = cover_square.resize((COVER_SIZE, COVER_SIZE), Image.Resampling.BILINEAR)
-
     x_cover = (CANVAS_SIZE - COVER_SIZE) // 2
     y_cover = TOP_MARGIN
-    canvas.paste(cover_resized, (x_cover, y_cover))
+    canvas.paste(cover_square, (x_cover, y_cover))
 
     return canvas
 
-def _prepare_scroll_resources(cover_img: Image.Image, artist: str, title: str):
+
+def _cover_identity(cover_img: Image.Image, cover_url: Optional[str]) -> str:
+    return cover_url or frame_hash(cover_img)
+
+
+def _resolve_colors(cover_img: Image.Image, cover_url: Optional[str], img_cfg: dict):
+    artwork = analyze_artwork(cover_img, cover_url)
+    use_dynamic_bg = img_cfg.get("use_dynamic_bg", True)
+    if use_dynamic_bg:
+        bg_color = artwork.bg_color
+    else:
+        bg_color = tuple(img_cfg["manual_bg_color"])
+
+    if img_cfg.get("use_dynamic_text_color", False):
+        text_color = artwork.text_color if use_dynamic_bg else dynamic_text_color(bg_color)
+    else:
+        text_color = tuple(img_cfg["text_color"])
+
+    return bg_color, text_color
+
+
+def _render_text_layer(artist: str, title: str):
+    font, glyph_h = _get_font_for_config()
+    w1, _ = text_size(artist, font)
+    w2, _ = text_size(title, font)
+    return {
+        "font": font,
+        "glyph_h": glyph_h,
+        "w1": w1,
+        "w2": w2,
+        "strip1": render_text_strip(artist, font),
+        "strip2": render_text_strip(title, font),
+    }
+
+
+def _prepare_scroll_resources(cover_img: Image.Image, artist: str, title: str, cover_url: Optional[str] = None):
     CONFIG = read_config()
     img_cfg = CONFIG["image"]
     CANVAS_SIZE = img_cfg["canvas_size"]
@@ -135,149 +278,415 @@ def _prepare_scroll_resources(cover_img: Image.Image, artist: str, title: str):
         artist = artist.upper()
         title = title.upper()
 
-    use_dynamic_bg = img_cfg.get("use_dynamic_bg", True)
-    if use_dynamic_bg:
-        bg_color = dynamic_bg_color(cover_img)
-    else:
-        bg_color = tuple(img_cfg["manual_bg_color"])
+    cover_id = _cover_identity(cover_img, cover_url)
 
-    base_canvas = _prepare_base_canvas(cover_img, bg_color)
+    cover_square = layer("cover").get(
+        {"cover": cover_id, "cover_size": COVER_SIZE},
+        lambda: square_cover(cover_img, COVER_SIZE),
+    )
 
-    font, glyph_h = _get_font_for_config()
-    w1, _ = text_size(artist, font)
-    w2, _ = text_size(title, font)
+    bg_color, TEXT_COLOR = layer("colors").get(
+        {
+            "cover": cover_id,
+            "use_dynamic_bg": img_cfg.get("use_dynamic_bg", True),
+            "manual_bg_color": tuple(img_cfg["manual_bg_color"]),
+            "use_dynamic_text_color": img_cfg.get("use_dynamic_text_color", False),
+            "text_color": tuple(img_cfg["text_color"]),
+            "lum_threshold": img_cfg.get("lum_threshold", 128),
+        },
+        lambda: _resolve_colors(cover_img, cover_url, img_cfg),
+    )
 
-    if img_cfg.get("use_dynamic_text_color", False):
-        TEXT_COLOR = dynamic_text_color(bg_color)
-    else:
-        TEXT_COLOR = tuple(img_cfg["text_color"])
+    base_canvas = layer("base_canvas").get(
+        {
+            "cover_square": layer("cover").builds,
+            "bg_color": bg_color,
+            "canvas_size": CANVAS_SIZE,
+            "top_margin": TOP_MARGIN,
+        },
+        lambda: _prepare_base_canvas(cover_square, bg_color),
+    )
 
+    text = layer("text").get(
+        {
+            "artist": artist,
+            "title": title,
+            "font_path": img_cfg["font_path"],
+            "font_size": img_cfg["font_size"],
+        },
+        lambda: _render_text_layer(artist, title),
+    )
+    glyph_h = text["glyph_h"]
+    w1 = text["w1"]
+    w2 = text["w2"]
 
     y_band = TOP_MARGIN + COVER_SIZE + GAP_BETWEEN_COVER_AND_BAND
     y_title = y_band + glyph_h + GAP_BETWEEN_LINES
 
+    both_scroll = (w1 > CANVAS_SIZE) and (w2 > CANVAS_SIZE)
+    sync_range = max(w1, w2) + CANVAS_SIZE if both_scroll else None
+    range1 = sync_range or w1 + CANVAS_SIZE
+    range2 = sync_range or w2 + CANVAS_SIZE
+
+    if w1 > CANVAS_SIZE and w2 > CANVAS_SIZE:
+        cycle = sync_range
+    elif w1 > CANVAS_SIZE:
+        cycle = range1
+    elif w2 > CANVAS_SIZE:
+        cycle = range2
+    else:
+        cycle = 0
+
     return {
         "artist": artist,
         "title": title,
         "bg_color": bg_color,
         "base_canvas": base_canvas,
-        "font": font,
+        "strip1": text["strip1"],
+        "strip2": text["strip2"],
+        "font": text["font"],
         "glyph_h": glyph_h,
         "w1": w1,
         "w2": w2,
         "y_band": y_band,
         "y_title": y_title,
+        "range1": range1,
+        "range2": range2,
+        "cycle": cycle,
         "TEXT_COLOR": TEXT_COLOR,
         "CANVAS_SIZE": CANVAS_SIZE,
     }
 
 
-def _scroll_loop(cover_img: Image.Image, artist: str, title: str):
+_CENTER_SPACING_CORR = 1
+
+
+def _text_x(w_text: int, tick: Optional[int], canvas_size: int, scroll_range: int) -> int:
+    if w_text <= canvas_size:
+        if w_text < canvas_size and _CENTER_SPACING_CORR > 0:
+            effective_w = max(0, w_text - _CENTER_SPACING_CORR)
+        else:
+            effective_w = w_text
+        return (canvas_size - effective_w) // 2
+
+    if tick is None:
+        return 0
+
+    offset = tick % scroll_range
+    return canvas_size - offset
+
+
+def _render_frame(res: dict, tick: Optional[int]) -> Image.Image:
+    canvas_size = res["CANVAS_SIZE"]
+
+    frame = res["base_canvas"].copy()
+
+    x_band = _text_x(res["w1"], tick, canvas_size, res["range1"])
+    x_title = _text_x(res["w2"], tick, canvas_size, res["range2"])
+
+    for (strip, dx, dy), x, y in (
+        (res["strip1"], x_band, res["y_band"]),
+        (res["strip2"], x_title, res["y_title"]),
+    ):
+        blit_strip(frame, strip, x + dx, y + dy, res["TEXT_COLOR"])
+    return frame
+
+
+def _save_debug_frames(frame: Image.Image) -> None:
     CONFIG = read_config()
     debug_log = CONFIG["debug"]["logs"]
     debug_cfg = CONFIG["debug"]
     img_cfg = CONFIG["image"]
 
+    pixoo_frame_path = debug_cfg.get("pixoo_frame_path", "")
+    preview_path = debug_cfg.get("preview_path", "")
+
+    if pixoo_frame_path:
+        frame.save(pixoo_frame_path)
+        if debug_log:
+            print(f"Finished: {pixoo_frame_path} created.")
+
+    if preview_path:
+        scale = img_cfg["preview_scale"]
+        size = img_cfg["canvas_size"]
+        preview = frame.resize(
+            (size * scale, size * scale),
+            Image.Resampling.NEAREST,
+        )
+        preview.save(preview_path)
+        if debug_log:
+            print(f"Finished: {preview_path} created.")
+
+
+_display_stats = {"frames_sent": 0, "frames_suppressed": 0, "last_frame_hash": None}
+_on_device: Optional[tuple] = None
+
+
+def frame_hash(frame: Image.Image) -> str:
+    return hashlib.blake2b(frame.tobytes(), digest_size=8).hexdigest()
+
+
+def _send_if_changed(pixoo: PixooClient, frame: Image.Image, last_hash: Optional[str]) -> str:
+    global _on_device
+
+    digest = frame_hash(frame)
+    if digest == last_hash:
+        _display_stats["frames_suppressed"] += 1
+        return digest
+
+    _on_device = None
+    pixoo.send_frame(frame)
+    _on_device = ("frame", digest)
+    _display_stats["frames_sent"] += 1
+    _display_stats["last_frame_hash"] = digest
+    return digest
+
+
+def _static_display(
+    cover_img: Image.Image,
+    artist: str,
+    title: str,
+    cover_url: Optional[str] = None,
+    res: Optional[dict] = None,
+):
+    debug_log = read_config()["debug"]["logs"]
+
     pixoo = _get_pixoo()
-    first_frame_saved = False
+    if res is None:
+        res = _prepare_scroll_resources(cover_img, artist, title, cover_url)
+
+    frame = _render_frame(res, None)
+    _save_debug_frames(frame)
+
+    if _on_device == ("frame", frame_hash(frame)):
+        _display_stats["frames_suppressed"] += 1
+        update_metrics("display", dict(_display_stats))
+        if debug_log:
+            print("Static frame unchanged on the Pixoo, skipping upload.")
+        return
+
+    try:
+        _send_if_changed(pixoo, frame, None)
+    except PixooError as e:
+        print(f"Pixoo not available or API-error: {e}")
+        return
+    finally:
+        update_metrics("display", dict(_display_stats))
+
+    if debug_log:
+        print("Static layout, frame sent once.")
+
 
-    res = _prepare_scroll_resources(cover_img, artist, title)
+def _scroll_loop(cover_img: Image.Image, artist: str, title: str, cover_url: Optional[str] = None):
+    CONFIG = read_config()
+    img_cfg = CONFIG["image"]
+
+    res = _prepare_scroll_resources(cover_img, artist, title, cover_url)
+    if res["cycle"] == 0:
+        _static_display(cover_img, artist, title, cover_url, res)
+        return
 
-    speed_px_per_s = img_cfg.get("marquee_speed", 18)
+    pixoo = _get_pixoo()
+    first_frame_saved = False
+
+    speed_px_per_s = max(img_cfg.get("marquee_speed", 18), 1)
     sleep_seconds = img_cfg.get("sleep_seconds", 0.01)
 
-    tick_float = 0.0
-    last_time = time.time()
+    pacer = FramePacer(min_interval=max(sleep_seconds, 1.0 / speed_px_per_s))
+    start = time.monotonic()
+    last_tick = None
+    last_hash = None
+
+    frames_rendered = 0
+    render_cpu_s = 0.0
 
-    w1 = res["w1"]
-    w2 = res["w2"]
+    while not _scroll_stop_event.is_set():
+        now = pacer.frame_start()
+        tick = int((now - start) * speed_px_per_s) % res["cycle"]
+
+        if tick == last_tick:
+            _display_stats["frames_suppressed"] += 1
+        else:
+            last_tick = tick
+
+            cpu_start = time.thread_time()
+            frame = _render_frame(res, tick)
+            render_cpu_s += time.thread_time() - cpu_start
+            frames_rendered += 1
+
+            if not first_frame_saved:
+                _save_debug_frames(frame)
+                first_frame_saved = True
+
+            sent_before = _display_stats["frames_sent"]
+            send_start = time.monotonic()
+            try:
+                last_hash = _send_if_changed(pixoo, frame, last_hash)
+            except PixooError as e:
+                print(f"Pixoo not available or API-error: {e}")
+                break
+            if _display_stats["frames_sent"] != sent_before:
+                pacer.record_send(time.monotonic() - send_start)
+
+            if frames_rendered % 100 == 0:
+                update_metrics("display", {
+                    **_display_stats,
+                    "frames_rendered": frames_rendered,
+                    "render_cpu_ms_per_frame": round(render_cpu_s * 1000 / frames_rendered, 3),
+                    "frames_per_cpu_second": round(frames_rendered / render_cpu_s, 1) if render_cpu_s > 0 else None,
+                })
+
+        if pacer.wait(_scroll_stop_event):
+            break
+
+
+def _build_animation(res: dict, max_frames: int) -> tuple[list[Image.Image], int]:
+    cycle = res["cycle"]
+    if cycle <= 0:
+        return [_render_frame(res, 0)], 0
+
+    step = max(1, -(-cycle // max(1, max_frames)))
+    frames = [_render_frame(res, tick) for tick in range(0, cycle, step)]
+    return frames, step
+
+
+def _animation_loop(cover_img: Image.Image, artist: str, title: str, cover_url: Optional[str] = None):
+    global _on_device
+
+    CONFIG = read_config()
+    debug_log = CONFIG["debug"]["logs"]
+    img_cfg = CONFIG["image"]
+    anim_cfg = img_cfg.get("animation", {})
+    max_frames = int(anim_cfg.get("max_frames", 59))
+
+    pixoo = _get_pixoo()
+    res = _prepare_scroll_resources(cover_img, artist, title, cover_url)
+
+    frames, step = layer("frames").get(
+        {
+            "base_canvas": layer("base_canvas").builds,
+            "text": layer("text").builds,
+            "text_color": res["TEXT_COLOR"],
+            "y_band": res["y_band"],
+            "y_title": res["y_title"],
+            "max_frames": max_frames,
+        },
+        lambda: _build_animation(res, max_frames),
+    )
+    speed_px_per_s = max(img_cfg.get("marquee_speed", 18), 1)
+    speed_ms = max(1, round(step * 1000 / speed_px_per_s)) if step else None
+
+    signature = ("animation", layer("frames").builds, speed_ms)
+    if _on_device == signature:
+        if debug_log:
+            print("Animation unchanged on the Pixoo, skipping upload.")
+        return
+
+    _save_debug_frames(frames[0])
+
+    try:
+        _on_device = None
+        sent = pixoo.send_animation(frames, speed_ms=speed_ms, stop_event=_scroll_stop_event)
+    except PixooError as e:
+        print(f"Pixoo not available or API-error: {e}")
+        return
+
+    if sent:
+        _on_device = signature
+    if debug_log and sent:
+        print(f"Uploaded {len(frames)}-frame marquee animation ({speed_ms or pixoo.gif_speed_ms} ms/frame).")
+
+
+def _device_text_display(cover_img: Image.Image, artist: str, title: str, cover_url: Optional[str] = None):
+    global _device_text_active, _on_device
+
+    CONFIG = read_config()
+    debug_log = CONFIG["debug"]["logs"]
+    img_cfg = CONFIG["image"]
+    text_cfg = img_cfg.get("device_text", {})
+
+    pixoo = _get_pixoo()
+    res = _prepare_scroll_resources(cover_img, artist, title, cover_url)
     canvas_size = res["CANVAS_SIZE"]
 
-    both_scroll = (w1 > canvas_size) and (w2 > canvas_size)
-    sync_range = max(w1, w2) + canvas_size if both_scroll else None
+    speed_px_per_s = max(img_cfg.get("marquee_speed", 18), 1)
+    speed_ms = round(1000 / speed_px_per_s)
+    font = int(text_cfg.get("font", 2))
+    y_offset = int(text_cfg.get("y_offset", 0))
 
-    center_spacing_corr = 1
+    _save_debug_frames(res["base_canvas"])
 
-    while not _scroll_stop_event.is_set():
-        now = time.time()
-        dt = now - last_time
-        last_time = now
-
-        tick_float += speed_px_per_s * dt
-        tick = int(tick_float)
-
-        frame = res["base_canvas"].copy()
-        draw = ImageDraw.Draw(frame)
-
-        def compute_x(w_text: int, tick_val: int) -> int:
-            if w_text <= canvas_size:
-                if w_text < canvas_size and center_spacing_corr > 0:
-                    effective_w = max(0, w_text - center_spacing_corr)
-                else:
-                    effective_w = w_text
-                return (canvas_size - effective_w) // 2
-
-            if both_scroll:
-                scroll_range = sync_range
-            else:
-                scroll_range = w_text + canvas_size
-
-            offset = tick_val % scroll_range
-            return canvas_size - offset
-
-        x_band = compute_x(w1, tick)
-        x_title = compute_x(w2, tick)
-
-        draw.text((x_band,  res["y_band"]),  res["artist"], font=res["font"], fill=res["TEXT_COLOR"])
-        draw.text((x_title, res["y_title"]), res["title"],  font=res["font"], fill=res["TEXT_COLOR"])
-
-        if not first_frame_saved:
-            pixoo_frame_path = debug_cfg.get("pixoo_frame_path", "")
-            preview_path = debug_cfg.get("preview_path", "")
-
-            if pixoo_frame_path:
-                frame.save(pixoo_frame_path)
-                if debug_log:
-                    print(f"Finished: {pixoo_frame_path} created.")
-
-            if preview_path:
-                scale = img_cfg["preview_scale"]
-                size = img_cfg["canvas_size"]
-                preview = frame.resize(
-                    (size * scale, size * scale),
-                    Image.Resampling.NEAREST,
-                )
-                preview.save(preview_path)
-                if debug_log:
-                    print(f"Finished: {preview_path} created.")
-
-            first_frame_saved = True
+    _on_device = None
+    try:
+        pixoo.clear_text()
+        pixoo.send_frame(res["base_canvas"])
+        _device_text_active = True
+
+        for text_id, (text, y) in enumerate(((res["artist"], res["y_band"]), (res["title"], res["y_title"]))):
+            if _scroll_stop_event.is_set():
+                return
+            pixoo.send_text(
+                text,
+                text_id=text_id + 1,
+                x=0,
+                y=y + y_offset,
+                color=res["TEXT_COLOR"],
+                font=font,
+                width=canvas_size,
+                speed_ms=speed_ms,
+                align=2,
+            )
+    except PixooError as e:
+        print(f"Pixoo not available or API-error: {e}")
+        return
 
-        try:
-            pixoo.send_frame(frame)
-        except PixooError as e:
-            print(f"Pixoo not available or API-error: {e}")
-            break
+    if debug_log:
+        print(f"Sent background and device-side text (font {font}, {speed_ms} ms/px).")
 
-        if _scroll_stop_event.wait(sleep_seconds):
-            break
 
+def _clear_device_text() -> None:
+    global _device_text_active
+
+    if not _device_text_active:
+        return
+
+    try:
+        _get_pixoo().clear_text()
+        _device_text_active = False
+    except PixooError as e:
+        print(f"Could not clear device text: {e}")
 
-def start_scrolling_display(cover_img: Image.Image, artist: str, title: str):
+
+_DISPLAY_MODES = {
+    "stream": _scroll_loop,
+    "static": _static_display,
+    "animation": _animation_loop,
+    "device_text": _device_text_display,
+}
+
+
+def start_scrolling_display(cover_img: Image.Image, artist: str, title: str, cover_url: Optional[str] = None):
     global _scroll_thread, _scroll_stop_event
 
     _stop_scroll_thread()
 
+    display_mode = read_config()["image"].get("display_mode", "stream")
+    target = _DISPLAY_MODES.get(display_mode, _scroll_loop)
+    if target is not _device_text_display:
+        _clear_device_text()
+
     _scroll_stop_event = threading.Event()
     _scroll_thread = threading.Thread(
-        target=_scroll_loop,
-        args=(cover_img, artist, title),
+        target=target,
+        args=(cover_img, artist, title, cover_url),
         daemon=True,
     )
     _scroll_thread.start()
 
 
 def show_fallback_image():
+    global _on_device
+
     CONFIG = read_config()
     debug_log = CONFIG["debug"]["logs"]
     fallback_cfg = CONFIG.get("fallback", {})
@@ -296,6 +705,7 @@ def show_fallback_image():
     size = img_cfg["canvas_size"]
 
     _stop_scroll_thread()
+    _clear_device_text()
 
     try:
         fallback_img = Image.open(path).convert("RGB")
@@ -305,6 +715,7 @@ def show_fallback_image():
         )
 
         pixoo = _get_pixoo()
+        _on_device = None
         pixoo.send_frame(fallback_resized)
         if debug_log:
             print(f"Fallback image '{path}' sent to Pixoo.")
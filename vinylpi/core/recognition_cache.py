@@ -0,0 +1,240 @@
+import base64
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from vinylpi.paths import RECOGNITION_CACHE_PATH
+from vinylpi.web.services.config import read_config
+from vinylpi.core.metrics import update_metrics
+
+CachedResult = tuple[str, str, Optional[str], Optional[str]]
+
+_MAX_HASHES_PER_ENTRY = 1000
+_MAX_CANDIDATES = 5
+_SAVE_DELAY_SECONDS = 60.0
+
+
+def _pack(arr: np.ndarray) -> str:
+    return base64.b64encode(arr.tobytes()).decode("ascii")
+
+
+def _unpack(data: str, dtype) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(data), dtype=dtype)
+
+
+class RecognitionCache:
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 300,
+        min_matches: int = 50,
+        min_age: float = 10.0,
+        min_fraction: float = 0.25,
+        min_margin: float = 1.5,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.min_matches = min_matches
+        self.min_age = min_age
+        self.min_fraction = min_fraction
+        self.min_margin = min_margin
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[int, dict] = OrderedDict()
+        self._index: dict[int, set[int]] = {}
+        self._next_id = 0
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Could not read recognition cache, starting empty: {e}")
+            return
+
+        for item in raw.get("entries", []):
+            try:
+                hashes = _unpack(item["hashes"], np.uint32)
+                times = _unpack(item["times"], np.int32)
+                result = tuple(item["result"])
+            except Exception:
+                continue
+            self._add(hashes, times, result, stored_at=float("-inf"))
+
+    def _save(self) -> None:
+        data = {
+            "entries": [
+                {
+                    "result": list(entry["result"]),
+                    "hashes": _pack(entry["hashes"]),
+                    "times": _pack(entry["times"]),
+                    "ts": entry["ts"],
+                }
+                for entry in self._entries.values()
+            ]
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"Could not write recognition cache: {e}")
+
+    def _add(self, hashes: np.ndarray, times: np.ndarray, result: CachedResult, stored_at: float) -> None:
+        entry_id = self._next_id
+        self._next_id += 1
+
+        self._entries[entry_id] = {
+            "result": result,
+            "hashes": hashes,
+            "times": times,
+            "ts": int(time.time()),
+            "stored_at": stored_at,
+        }
+        for h in np.unique(hashes).tolist():
+            self._index.setdefault(h, set()).add(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            old_id, old = self._entries.popitem(last=False)
+            for h in np.unique(old["hashes"]).tolist():
+                ids = self._index.get(h)
+                if ids is not None:
+                    ids.discard(old_id)
+                    if not ids:
+                        del self._index[h]
+
+    def _offset_score(self, entry: dict, query: dict[int, list[int]]) -> tuple[int, int]:
+        entry_times: dict[int, list[int]] = {}
+        for h, t in zip(entry["hashes"].tolist(), entry["times"].tolist()):
+            entry_times.setdefault(h, []).append(t)
+
+        support: defaultdict[int, set[int]] = defaultdict(set)
+        for h, query_times in query.items():
+            for offset in {t - tq for t in entry_times.get(h, ()) for tq in query_times}:
+                support[offset].add(h)
+        if not support:
+            return 0, 0
+
+        def around(offset: int) -> int:
+            return len(support.get(offset - 1, set()) | support[offset] | support.get(offset + 1, set()))
+
+        best_offset = max(support, key=around)
+        best = around(best_offset)
+        runner_up = max((around(o) for o in list(support) if abs(o - best_offset) > 2), default=0)
+        return best, runner_up
+
+    def lookup(self, hashes: np.ndarray, times: np.ndarray) -> Optional[CachedResult]:
+        with self._lock:
+            query: dict[int, list[int]] = {}
+            for h, t in zip(hashes.tolist(), times.tolist()):
+                query.setdefault(h, []).append(t)
+
+            fresh_after = time.monotonic() - self.min_age
+            votes = Counter()
+            for h in query:
+                for entry_id in self._index.get(h, ()):
+                    if self._entries[entry_id]["stored_at"] <= fresh_after:
+                        votes[entry_id] += 1
+
+            needed = max(self.min_matches, self.min_fraction * len(query))
+            best_id, best_score = None, 0
+            for entry_id, count in votes.most_common(_MAX_CANDIDATES):
+                if count < needed:
+                    break
+                score, runner_up = self._offset_score(self._entries[entry_id], query)
+                if score >= needed and score >= self.min_margin * runner_up and score > best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                self.misses += 1
+                self._publish()
+                return None
+
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            self._publish()
+            return self._entries[best_id]["result"]
+
+    def store(self, hashes: np.ndarray, times: np.ndarray, result: CachedResult) -> None:
+        if len(hashes) == 0:
+            return
+
+        if len(hashes) > _MAX_HASHES_PER_ENTRY:
+            keep = np.linspace(0, len(hashes) - 1, _MAX_HASHES_PER_ENTRY).astype(int)
+            hashes, times = hashes[keep], times[keep]
+
+        with self._lock:
+            self._add(hashes.copy(), times.copy(), result, stored_at=time.monotonic())
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(_SAVE_DELAY_SECONDS, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+            self._publish()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._save()
+            self._dirty = False
+
+    def _publish(self) -> None:
+        total = self.hits + self.misses
+        update_metrics("recognition_cache", {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        })
+
+
+_cache: Optional[RecognitionCache] = None
+
+
+def get_recognition_cache() -> Optional[RecognitionCache]:
+    global _cache
+
+    cfg = read_config()
+    cache_cfg = cfg.get("recognition", {}).get("cache", {})
+    if not cache_cfg.get("enabled", True):
+        return None
+
+    if _cache is None:
+        _cache = RecognitionCache(
+            RECOGNITION_CACHE_PATH,
+            max_entries=int(cache_cfg.get("max_entries", 300)),
+            min_matches=int(cache_cfg.get("min_matches", 50)),
+            min_age=float(cache_cfg.get("min_age_seconds", 10)),
+            min_fraction=float(cache_cfg.get("min_fraction", 0.25)),
+            min_margin=float(cache_cfg.get("min_margin", 1.5)),
+        )
+    else:
+        _cache.max_entries = int(cache_cfg.get("max_entries", 300))
+        _cache.min_matches = int(cache_cfg.get("min_matches", 50))
+        _cache.min_age = float(cache_cfg.get("min_age_seconds", 10))
+        _cache.min_fraction = float(cache_cfg.get("min_fraction", 0.25))
+        _cache.min_margin = float(cache_cfg.get("min_margin", 1.5))
+    return _cache
+
+
+def flush_recognition_cache() -> None:
+    if _cache is not None:
+        _cache.flush()
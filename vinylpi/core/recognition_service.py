@@ -0,0 +1,116 @@
+import asyncio
+import threading
+from typing import Any, Optional
+
+import aiohttp
+from shazamio import Shazam
+from shazamio.exceptions import BadMethod
+from shazamio.interfaces.client import HTTPClientInterface
+from shazamio.utils import validate_json
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_STATUS_RETRIES = 2
+_BACKOFF_SECONDS = 0.5
+
+
+class PooledHTTPClient(HTTPClientInterface):
+    def __init__(self, limit: int = 4, keepalive_timeout: float = 60.0):
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(self, method: str, url: str, *args, **kwargs) -> Any:
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise BadMethod("Accept only GET/POST")
+
+        status_retries = 0
+        reconnected = False
+        while True:
+            session = self._get_session()
+            try:
+                async with session.request(method, url, **kwargs) as resp:
+                    if resp.status not in _RETRY_STATUSES or status_retries >= _STATUS_RETRIES:
+                        return await validate_json(resp, *args)
+            except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError):
+                if reconnected:
+                    raise
+                reconnected = True
+                continue
+            await asyncio.sleep(_BACKOFF_SECONDS * 2 ** status_retries)
+            status_retries += 1
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class RecognitionService:
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._http_client = PooledHTTPClient()
+        self._shazam: Optional[Shazam] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def http_client(self) -> PooledHTTPClient:
+        return self._http_client
+
+    @property
+    def shazam(self) -> Shazam:
+        if self._shazam is None:
+            self._shazam = Shazam(http_client=self._http_client)
+        return self._shazam
+
+    def run(self, coro, timeout: Optional[float] = None):
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        try:
+            self.run(self._http_client.close(), timeout=5)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+
+_service: Optional[RecognitionService] = None
+_service_lock = threading.Lock()
+
+
+def get_recognition_service() -> RecognitionService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = RecognitionService()
+        return _service
+
+
+def close_recognition_service() -> None:
+    global _service
+    with _service_lock:
+        if _service is not None:
+            _service.close()
+            _service = None
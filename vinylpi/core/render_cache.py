@@ -0,0 +1,56 @@
+from typing import Any, Callable, Optional
+
+from vinylpi.web.services.config import read_config
+from vinylpi.core.metrics import update_metrics
+
+
+class RenderLayer:
+    def __init__(self, name: str):
+        self.name = name
+        self.key: Optional[dict] = None
+        self.value: Any = None
+        self.hits = 0
+        self.builds = 0
+
+    def get(self, key: dict, build: Callable[[], Any]) -> Any:
+        debug_log = read_config()["debug"]["logs"]
+
+        if self.key == key:
+            self.hits += 1
+            if debug_log:
+                print(f"Render cache: reusing {self.name} layer.")
+            return self.value
+
+        if debug_log:
+            if self.key is None:
+                print(f"Render cache: building {self.name} layer.")
+            else:
+                changed = sorted(k for k in key if self.key.get(k) != key[k])
+                print(f"Render cache: rebuilding {self.name} layer ({', '.join(changed)} changed).")
+
+        self.value = build()
+        self.key = dict(key)
+        self.builds += 1
+        _publish()
+        return self.value
+
+    def clear(self) -> None:
+        self.key = None
+        self.value = None
+
+
+LAYERS = {
+    name: RenderLayer(name)
+    for name in ("cover", "colors", "base_canvas", "text", "frames")
+}
+
+
+def layer(name: str) -> RenderLayer:
+    return LAYERS[name]
+
+
+def _publish() -> None:
+    update_metrics("render_cache", {
+        name: {"builds": lyr.builds, "hits": lyr.hits}
+        for name, lyr in LAYERS.items()
+    })
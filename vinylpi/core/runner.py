@@ -1,30 +1,55 @@
+import threading
 import time
-from vinylpi.core.audio_capture import record_sample
-from vinylpi.core.recognition import recognize_song
+from vinylpi.core.audio_capture import stop_audio_source, is_replay_finished
+from vinylpi.core.audio_gate import MUSIC
+from vinylpi.core.pipeline import CapturePipeline, build_window, wait_for_next_window
+from vinylpi.core.scheduler import PollScheduler
+from vinylpi.core.recognition import recognize_song, last_match_offset
+from vinylpi.core.recognition_service import close_recognition_service
+from vinylpi.core.recognition_cache import flush_recognition_cache
+from vinylpi.core.metrics import flush_metrics
 from vinylpi.web.services.config import read_config
 from vinylpi.config.config_watcher import maybe_log_config_reload
 from vinylpi.core.title_variants import is_live_variant
-from vinylpi.core.loop_state import LoopConfig, DisplayState, AlbumState, StatsSwitchState
+from vinylpi.core.loop_state import LoopConfig, DisplayState, AlbumState, StatsSwitchState, TrackLockState
 from vinylpi.core.loop_logic import (
     handle_no_result,
     handle_song_result,
     update_song_stats_on_switch,
     update_album_session_on_switch,
     maybe_add_listen_time,
+    should_skip_recognition,
+    update_track_lock,
+    clear_track_lock,
 )
 
+def _idle(delay: float, pipeline: CapturePipeline | None) -> bool:
+    if pipeline is not None:
+        pipeline.set_hop(delay)
+        return False
+    return wait_for_next_window(delay, threading.Event())
+
+
 def main_loop():
     cfg = LoopConfig.from_config(read_config())
     if cfg.debug_log:
         print(f"\nStarting to loop VinylPi64 (every {cfg.delay}s)\n")
 
+    pipeline = None
+    if cfg.pipeline_enabled:
+        pipeline = CapturePipeline.from_config(read_config())
+        pipeline.start()
+
     disp = DisplayState()
     album_state = AlbumState()
     stats_state = StatsSwitchState()
+    track_lock = TrackLockState()
+    scheduler = PollScheduler()
 
     MIN_TRACKS_FOR_ALBUM_SESSION = 2
     MIN_CONSECUTIVE_FOR_SWITCH = 2
 
+    after_boundary = False
     while True:
         try:
             cfg_reloaded = maybe_log_config_reload()
@@ -33,17 +58,44 @@ def main_loop():
             if cfg.debug_log:
                 print("Recording sample...")
 
-            wav_bytes = record_sample()
-            if not wav_bytes:
+            if pipeline is not None:
+                window = pipeline.get(timeout=pipeline.hop_seconds + 10)
+            else:
+                window = build_window(after_boundary=after_boundary)
+            if window is None:
+                if is_replay_finished():
+                    print("Replay finished, stopping.")
+                    break
                 print("No recording possible, trying again in 5s...")
-                time.sleep(5)
+                if pipeline is None:
+                    time.sleep(5)
+                continue
+
+            if window.after_boundary:
+                scheduler.reset()
+                clear_track_lock(track_lock)
+
+            if window.verdict != MUSIC:
+                if handle_no_result(cfg, disp, cfg_reloaded, gated=True):
+                    break
+                after_boundary = _idle(cfg.delay, pipeline)
                 continue
 
-            result = recognize_song(wav_bytes)
+            fingerprint = window.fingerprint
+            if should_skip_recognition(cfg, track_lock, fingerprint, cfg_reloaded):
+                after_boundary = _idle(scheduler.next_delay(cfg), pipeline)
+                continue
+
+            result = recognize_song(
+                window.audio,
+                window.sample_rate,
+                landmarks=window.landmarks,
+                alternates=window.alternates,
+            )
             if result is None:
                 if handle_no_result(cfg, disp, cfg_reloaded):
                     break
-                time.sleep(cfg.delay)
+                after_boundary = _idle(cfg.delay, pipeline)
                 continue
 
             if result is not None:
@@ -62,14 +114,17 @@ def main_loop():
 
                         if handle_no_result(cfg, disp, cfg_reloaded):
                             break
-                        time.sleep(cfg.delay)
+                        after_boundary = _idle(cfg.delay, pipeline)
                         continue
 
             info = handle_song_result(cfg, disp, cfg_reloaded, result)
             if info is None:
-                time.sleep(cfg.delay)
+                after_boundary = _idle(cfg.delay, pipeline)
                 continue
 
+            window_seconds = len(window.audio) / window.sample_rate
+            scheduler.on_song(info["song_id"], window.captured_at - window_seconds, last_match_offset())
+
             did_confirm = update_song_stats_on_switch(
                 st=stats_state,
                 song_id=info["song_id"],
@@ -78,7 +133,15 @@ def main_loop():
                 album=info["album"],
                 min_consecutive=MIN_CONSECUTIVE_FOR_SWITCH,
             )
-            maybe_add_listen_time(cfg, did_confirm, info["artist"], info["title"], info["album"])
+            listen = maybe_add_listen_time(cfg, did_confirm, info["artist"], info["title"], info["album"])
+            if listen and listen.get("ok"):
+                scheduler.on_duration(info["song_id"], float(listen["minutes"]) * 60.0)
+            update_track_lock(
+                st=track_lock,
+                stats_st=stats_state,
+                song_id=info["song_id"],
+                fingerprint=fingerprint,
+            )
 
             update_album_session_on_switch(
                 st=album_state,
@@ -91,4 +154,11 @@ def main_loop():
         except Exception as e:
             print(f"Error in loop: {e}")
 
-        time.sleep(cfg.delay)
+        after_boundary = _idle(scheduler.next_delay(cfg), pipeline)
+
+    if pipeline is not None:
+        pipeline.stop()
+    stop_audio_source()
+    close_recognition_service()
+    flush_recognition_cache()
+    flush_metrics()
@@ -0,0 +1,62 @@
+import time
+from typing import Optional
+
+from vinylpi.core.loop_state import LoopConfig
+from vinylpi.core.metrics import update_metrics
+
+_MAX_KNOWN_DURATIONS = 64
+
+
+class PollScheduler:
+    def __init__(self):
+        self.song_id: Optional[tuple[str, str]] = None
+        self.started_at: Optional[float] = None
+        self.duration_s: Optional[float] = None
+        self.anchored = False
+        self.durations: dict[tuple[str, str], float] = {}
+
+    def reset(self) -> None:
+        self.song_id = None
+        self.started_at = None
+        self.duration_s = None
+        self.anchored = False
+
+    def on_song(self, song_id: tuple[str, str], window_start: float, match_offset: Optional[float] = None) -> None:
+        anchored = match_offset is not None
+        if song_id == self.song_id and (self.anchored or not anchored):
+            return
+        if song_id != self.song_id:
+            self.duration_s = self.durations.get(song_id)
+        self.song_id = song_id
+        self.started_at = window_start - (match_offset or 0.0)
+        self.anchored = anchored
+
+    def on_duration(self, song_id: tuple[str, str], duration_s: float) -> None:
+        if duration_s <= 0:
+            return
+        self.durations.pop(song_id, None)
+        self.durations[song_id] = duration_s
+        if len(self.durations) > _MAX_KNOWN_DURATIONS:
+            del self.durations[next(iter(self.durations))]
+        if song_id == self.song_id:
+            self.duration_s = duration_s
+
+    def remaining(self, now: Optional[float] = None) -> Optional[float]:
+        if self.started_at is None or self.duration_s is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return self.started_at + self.duration_s - now
+
+    def next_delay(self, cfg: LoopConfig, now: Optional[float] = None) -> float:
+        delay = float(cfg.delay)
+        remaining = self.remaining(now) if cfg.adaptive_polling else None
+
+        if remaining is not None and remaining > cfg.boundary_window:
+            slack = float(remaining - cfg.boundary_window)
+            delay = max(delay, min(float(cfg.max_delay), slack))
+
+        update_metrics("scheduler", {
+            "next_delay_s": round(delay, 2),
+            "predicted_remaining_s": round(remaining, 1) if remaining is not None else None,
+        })
+        return delay
@@ -2,17 +2,23 @@ from __future__ import annotations
 
 import base64
 import json
-from typing import Optional
+import threading
+from typing import Optional, Union
 
+import numpy as np
 import requests
 from PIL import Image
 from pathlib import Path
 
 from vinylpi.web.services.config import read_config
 from vinylpi.integrations.pixoo_discovery import discover_pixoo_ip, _probe_ip
+from vinylpi.integrations import pixoo_http
 
 from vinylpi.paths import CLOUD_BASE_URL, CONFIG_PATH
 
+Frame = Union[Image.Image, np.ndarray]
+
+
 class PixooError(Exception):
     pass
 
@@ -83,7 +89,7 @@ class PixooClient:
     def _cloud_post(self, path: str, payload: dict) -> dict:
         url = f"{CLOUD_BASE_URL}{path}"
         try:
-            resp = requests.post(url, json=payload, timeout=self.timeout)
+            resp = pixoo_http.request("cloud", "POST", url, json=payload, timeout=self.timeout)
             resp.raise_for_status()
         except requests.RequestException as e:
             raise PixooError(f"HTTP error on Divoom cloud API: {e}") from e
@@ -131,11 +137,7 @@ class PixooClient:
 
     def _post(self, payload: dict) -> dict:
         try:
-            resp = requests.post(
-                self.base_url,
-                json=payload,
-                timeout=self.timeout,
-            )
+            resp = pixoo_http.request("local", "POST", self.base_url, json=payload, timeout=self.timeout)
             resp.raise_for_status()
         except requests.RequestException as e:
             raise PixooError(f"HTTP-Error on sending image to pixoo: {e}") from e
@@ -162,34 +164,51 @@ class PixooClient:
         self._post({"Command": "Draw/ResetHttpGifId"})
 
     @staticmethod
-    def _image_to_rgb_bytes(img: Image.Image) -> bytes:
-        if img.mode != "RGB":
+    def _frame_size(frame: Frame) -> tuple[int, int]:
+        if isinstance(frame, np.ndarray):
+            return frame.shape[1], frame.shape[0]
+        return frame.size
+
+    @staticmethod
+    def _image_to_rgb_bytes(img: Frame) -> Union[bytes, memoryview]:
+        if isinstance(img, np.ndarray):
+            if img.ndim != 3 or img.shape[2] != 3:
+                raise PixooError(f"Pixoo expects an HxWx3 RGB array, received shape: {img.shape}")
+            height, width = img.shape[:2]
+        elif img.mode != "RGB":
             img = img.convert("RGB")
+            width, height = img.size
+        else:
+            width, height = img.size
 
-        width, height = img.size
         if width != height:
-            raise PixooError(f"Pixoo expects quadratic image, received: {img.size}")
+            raise PixooError(f"Pixoo expects quadratic image, received: {(width, height)}")
 
         if width not in (16, 32, 64):
             raise PixooError(
                 f"Pixoo only supports 16, 32 or 64 pixel width/height, received: {width}"
             )
 
-        buf = bytearray()
-        for y in range(height):
-            for x in range(width):
-                r, g, b = img.getpixel((x, y))
-                buf.extend((r, g, b))
+        if isinstance(img, np.ndarray):
+            return memoryview(np.ascontiguousarray(img, dtype=np.uint8).reshape(-1))
+        return img.tobytes()
 
-        return bytes(buf)
+    def send_frame(self, frame: Frame, *, speed_ms: Optional[int] = None) -> None:
+        self.send_animation([frame], speed_ms=speed_ms)
 
-    def send_frame(self, frame: Image.Image, *, speed_ms: Optional[int] = None) -> None:
-        width, height = frame.size
-        if width != height:
-            raise PixooError(f"Pixoo expects quadratic image, received: {frame.size}")
+    def send_animation(
+        self,
+        frames: list[Frame],
+        *,
+        speed_ms: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+    ) -> bool:
+        if not frames:
+            raise PixooError("send_animation needs at least one frame")
 
-        raw_rgb = self._image_to_rgb_bytes(frame)
-        pic_data_b64 = base64.b64encode(raw_rgb).decode("ascii")
+        width, height = self._frame_size(frames[0])
+        if width != height:
+            raise PixooError(f"Pixoo expects quadratic image, received: {(width, height)}")
 
         if self.auto_reset_gif_id:
             self.reset_pic_id() 
@@ -198,23 +217,69 @@ class PixooClient:
 
         speed = self.gif_speed_ms if speed_ms is None else int(speed_ms)
 
-        payload = {
-            "Command": "Draw/SendHttpGif",
-            "PicNum": 1,
-            "PicWidth": width,
-            "PicOffset": 0,
-            "PicID": pic_id,
-            "PicSpeed": speed,
-            "PicSpped": speed,
-            "PicData": pic_data_b64,
-        }
+        for offset, frame in enumerate(frames):
+            if stop_event is not None and stop_event.is_set():
+                return False
+
+            if self._frame_size(frame) != (width, height):
+                raise PixooError(
+                    f"All animation frames must be {width}x{height}, received: {self._frame_size(frame)}"
+                )
+
+            raw_rgb = self._image_to_rgb_bytes(frame)
+            pic_data_b64 = base64.b64encode(raw_rgb).decode("ascii")
+
+            payload = {
+                "Command": "Draw/SendHttpGif",
+                "PicNum": len(frames),
+                "PicWidth": width,
+                "PicOffset": offset,
+                "PicID": pic_id,
+                "PicSpeed": speed,
+                "PicSpped": speed,
+                "PicData": pic_data_b64,
+            }
+
+            self._post(payload)
+
+        return True
+
+    def send_text(
+        self,
+        text: str,
+        *,
+        text_id: int,
+        x: int,
+        y: int,
+        color: tuple[int, int, int],
+        font: int = 2,
+        width: int = 64,
+        speed_ms: int = 50,
+        direction: int = 0,
+        align: int = 1,
+    ) -> None:
+        r, g, b = color
+        self._post({
+            "Command": "Draw/SendHttpText",
+            "TextId": int(text_id),
+            "x": int(x),
+            "y": int(y),
+            "dir": int(direction),
+            "font": int(font),
+            "TextWidth": max(16, min(64, int(width))),
+            "speed": max(1, int(speed_ms)),
+            "TextString": text,
+            "color": f"#{r:02X}{g:02X}{b:02X}",
+            "align": int(align),
+        })
 
-        self._post(payload)
+    def clear_text(self) -> None:
+        self._post({"Command": "Draw/ClearHttpText"})
 
     def discover_cloud_device(self) -> dict:
         url = f"{CLOUD_BASE_URL}/Device/ReturnSameLANDevice"
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = pixoo_http.request("cloud", "GET", url, timeout=self.timeout)
             resp.raise_for_status()
         except requests.RequestException as e:
             raise PixooError(f"Error calling Divoom discovery API: {e}") from e
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class MockPixooServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+
+        self.requests = 0
+        self.connections = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.frames = 0
+        self.commands: Counter[str] = Counter()
+
+        self._pic_id = 1
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> "MockPixooServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+            self.bytes_received = 0
+            self.bytes_sent = 0
+            self.frames = 0
+            self.commands.clear()
+
+    def _respond(self, payload: dict) -> dict:
+        command = payload.get("Command", "")
+        with self._lock:
+            self.requests += 1
+            self.commands[command] += 1
+
+            if command == "Channel/GetAllConf":
+                return {"error_code": 0, "DeviceName": "Mock Pixoo", "Brightness": 100}
+            if command == "Draw/GetHttpGifId":
+                return {"error_code": 0, "PicId": self._pic_id}
+            if command == "Draw/ResetHttpGifId":
+                self._pic_id = 1
+            elif command == "Draw/SendHttpGif":
+                self.frames += 1
+                if payload.get("PicOffset", 0) == payload.get("PicNum", 1) - 1:
+                    self._pic_id += 1
+            return {"error_code": 0}
+
+    def _delay(self) -> None:
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms += self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length)
+                try:
+                    payload = json.loads(raw or b"{}")
+                except json.JSONDecodeError:
+                    payload = {}
+
+                server._delay()
+                body = json.dumps(server._respond(payload)).encode("utf-8")
+                with server._lock:
+                    server.bytes_received += length
+                    server.bytes_sent += len(body)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for a Pixoo's HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = MockPixooServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+    ).start()
+
+    print(f"Mock Pixoo listening on http://{server.address}/post")
+    try:
+        while True:
+            time.sleep(5)
+            print(
+                f"  {server.requests} requests over {server.connections} connections, "
+                f"{server.frames} frames, {server.bytes_received / 1024:.0f} KiB received"
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
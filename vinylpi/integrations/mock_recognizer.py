@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+from vinylpi.paths import BASE_DIR
+
+DEFAULT_RESPONSES_PATH = BASE_DIR / "assets" / "mock" / "recognizer_responses.json"
+COVER_COLORS = [(200, 60, 40), (40, 90, 180), (230, 190, 40), (60, 160, 90)]
+
+
+def load_responses(path: Path | str | None = None) -> list[dict]:
+    path = Path(path) if path else DEFAULT_RESPONSES_PATH
+    if path.is_dir():
+        responses = []
+        for f in sorted(path.glob("*.json")):
+            data = json.loads(f.read_text(encoding="utf-8"))
+            responses.extend(data if isinstance(data, list) else [data])
+        return responses
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data if isinstance(data, list) else [data]
+
+
+class MockRecognizerServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        responses: Optional[list[dict]] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        no_match_rate: float = 0.0,
+        cover_size: int = 600,
+        seed: Optional[int] = None,
+    ):
+        self.responses = responses if responses is not None else load_responses()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.no_match_rate = no_match_rate
+        self.cover_size = cover_size
+
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+
+        self._rng = random.Random(seed)
+        self._next = 0
+        self._lock = threading.Lock()
+        self._covers: dict[int, bytes] = {}
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def recognize_url(self) -> str:
+        return f"{self.base_url}/recognize"
+
+    def start(self) -> "MockRecognizerServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _cover_png(self, idx: int) -> bytes:
+        if idx not in self._covers:
+            color = COVER_COLORS[idx % len(COVER_COLORS)]
+            img = Image.new("RGB", (self.cover_size, self.cover_size), color)
+            buf = BytesIO()
+            img.save(buf, format="PNG")
+            self._covers[idx] = buf.getvalue()
+        return self._covers[idx]
+
+    def _next_response(self) -> tuple[int, dict]:
+        with self._lock:
+            self.requests += 1
+            if self._rng.random() < self.error_rate:
+                self.errors += 1
+                return 500, {"error": "mock failure"}
+            if not self.responses or self._rng.random() < self.no_match_rate:
+                return 200, {"matches": []}
+            response = self.responses[self._next % len(self.responses)]
+            self._next += 1
+
+        text = json.dumps(response).replace("{base_url}", self.base_url)
+        return 200, json.loads(text)
+
+    def _delay(self) -> None:
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms += self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                server.bytes_received += length
+
+                server._delay()
+                status, payload = server._next_response()
+                self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+            def do_GET(self):
+                if self.path.startswith("/cover/") and self.path.endswith(".png"):
+                    try:
+                        idx = int(self.path[len("/cover/"):-len(".png")])
+                    except ValueError:
+                        idx = 0
+                    body = server._cover_png(idx)
+                    etag = f'"cover-{idx}-{len(body)}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "image/png")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                self._send(404, b"{}", "application/json")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the recognition service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--responses", default=None, help="JSON file or directory with recorded responses")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--no-match-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = MockRecognizerServer(
+        host=args.host,
+        port=args.port,
+        responses=load_responses(args.responses),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        no_match_rate=args.no_match_rate,
+    ).start()
+
+    print(f"Mock recognizer listening on {server.recognize_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
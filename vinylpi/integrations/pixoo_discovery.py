@@ -2,9 +2,10 @@ from __future__ import annotations
 from typing import Optional
 import requests
 from vinylpi.web.services.config import read_config
+from vinylpi.integrations import pixoo_http
 
 
-def _probe_ip(ip: str, timeout: float) -> bool:
+def _probe_ip(ip: str, timeout: float, session: Optional[requests.Session] = None) -> bool:
     CONFIG = read_config()
     debug_log = CONFIG["debug"]["logs"]
     url = f"http://{ip}/post"
@@ -13,7 +14,8 @@ def _probe_ip(ip: str, timeout: float) -> bool:
     divoom_cfg = CONFIG.get("divoom", {})
 
     try:
-        resp = requests.post(url, json=payload, timeout=timeout)
+        kind = "local" if session is None else "discovery"
+        resp = pixoo_http.request(kind, "POST", url, json=payload, timeout=timeout, session=session)
         resp.raise_for_status()
 
         server_header = resp.headers.get("Server", "").lower()
@@ -63,13 +65,14 @@ def discover_pixoo_ip() -> Optional[str]:
     if debug_log:
         print(f"Starting pixoo discovery from subnet: {subnet_prefix}{start}-{end} ...")
 
-    for host in range(start, end + 1):
-        ip = f"{subnet_prefix}{host}"
-        if debug_log:
-            print(f"  Trying {ip} ...", end="\r")
-        if _probe_ip(ip, timeout) and debug_log:
-            print(f"\nPixoofound under {ip}")
-            return ip
+    with pixoo_http.scan_session() as session:
+        for host in range(start, end + 1):
+            ip = f"{subnet_prefix}{host}"
+            if debug_log:
+                print(f"  Trying {ip} ...", end="\r")
+            if _probe_ip(ip, timeout, session) and debug_log:
+                print(f"\nPixoofound under {ip}")
+                return ip
 
     print("\nNo Pixoo device found in the specified subnet range.")
     return None
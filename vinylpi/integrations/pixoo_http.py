@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from vinylpi.paths import CONFIG_PATH
+from vinylpi.web.services.config import read_config
+from vinylpi.core.metrics import update_metrics
+
+_CLOUD_RETRIES = 2
+_CLOUD_BACKOFF_SECONDS = 0.3
+_EWMA_ALPHA = 0.2
+
+_sessions: dict[str, requests.Session] = {}
+_settings: dict[str, tuple] = {}
+_config_seen: dict[str, Optional[float]] = {}
+_stats: dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+def _local_settings(cfg: dict) -> tuple[int, int, float]:
+    http_cfg = cfg.get("divoom", {}).get("http", {})
+    return (
+        max(1, int(http_cfg.get("pool_maxsize", 2))),
+        max(0, int(http_cfg.get("retries", 1))),
+        float(http_cfg.get("backoff_seconds", 0.05)),
+    )
+
+
+def _build_session(pool_maxsize: int, retry: Retry) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _config_mtime() -> Optional[float]:
+    try:
+        return CONFIG_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _local_retry(retries: int, backoff: float) -> Retry:
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=0,
+        backoff_factor=backoff,
+        raise_on_status=False,
+    )
+
+
+def _cloud_retry() -> Retry:
+    return Retry(
+        total=_CLOUD_RETRIES,
+        backoff_factor=_CLOUD_BACKOFF_SECONDS,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+
+
+def _session(kind: str) -> requests.Session:
+    mtime = _config_mtime() if kind == "local" else None
+
+    with _lock:
+        session = _sessions.get(kind)
+        if session is not None and _config_seen.get(kind) == mtime:
+            return session
+
+        if kind == "local":
+            pool_maxsize, retries, backoff = _local_settings(read_config())
+            wanted = (pool_maxsize, retries, backoff)
+            retry = _local_retry(retries, backoff)
+        else:
+            wanted = ("cloud",)
+            pool_maxsize = 1
+            retry = _cloud_retry()
+
+        _config_seen[kind] = mtime
+        if session is not None and _settings.get(kind) == wanted:
+            return session
+        if session is not None:
+            session.close()
+        session = _build_session(pool_maxsize, retry)
+        _sessions[kind] = session
+        _settings[kind] = wanted
+        return session
+
+
+def scan_session() -> requests.Session:
+    return _build_session(1, Retry(total=0, read=False, redirect=False))
+
+
+def _record(kind: str, elapsed_ms: float, ok: bool) -> None:
+    with _lock:
+        stats = _stats.setdefault(kind, {
+            "requests": 0,
+            "errors": 0,
+            "avg_ms": 0.0,
+            "max_ms": 0.0,
+            "last_ms": 0.0,
+        })
+        stats["requests"] += 1
+        if not ok:
+            stats["errors"] += 1
+        stats["last_ms"] = round(elapsed_ms, 2)
+        stats["max_ms"] = round(max(stats["max_ms"], elapsed_ms), 2)
+        if stats["requests"] == 1:
+            stats["avg_ms"] = round(elapsed_ms, 2)
+        else:
+            stats["avg_ms"] = round(stats["avg_ms"] + _EWMA_ALPHA * (elapsed_ms - stats["avg_ms"]), 2)
+        snapshot = dict(stats)
+
+    update_metrics("pixoo_http", {kind: snapshot})
+
+
+def request(
+    kind: str,
+    method: str,
+    url: str,
+    *,
+    timeout: float,
+    session: Optional[requests.Session] = None,
+    **kwargs,
+) -> requests.Response:
+    session = session or _session(kind)
+    start = time.perf_counter()
+    ok = False
+    try:
+        resp = session.request(method, url, timeout=timeout, **kwargs)
+        ok = resp.ok
+        return resp
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        _record(kind, elapsed_ms, ok)
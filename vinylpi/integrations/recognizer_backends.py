@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from vinylpi.web.services.config import read_config
+from vinylpi.core.recognition_service import get_recognition_service
+
+
+class RecognizerError(Exception):
+    pass
+
+
+class RecognizerBackend(ABC):
+    name = "backend"
+
+    def __init__(self, timeout: float = 15.0, retries: int = 0):
+        self.timeout = timeout
+        self.retries = retries
+
+    @abstractmethod
+    async def _recognize(self, wav_bytes: bytes) -> dict:
+        ...
+
+    async def recognize(self, wav_bytes: bytes) -> dict:
+        last_error: Optional[Exception] = None
+        for _ in range(self.retries + 1):
+            try:
+                result = await asyncio.wait_for(self._recognize(wav_bytes), timeout=self.timeout)
+            except Exception as e:
+                last_error = e
+                continue
+
+            if not isinstance(result, dict):
+                raise RecognizerError(f"{self.name}: unexpected response {result!r}")
+            return result
+
+        raise RecognizerError(f"{self.name} failed: {last_error!r}") from last_error
+
+
+class ShazamBackend(RecognizerBackend):
+    name = "shazam"
+
+    async def _recognize(self, wav_bytes: bytes) -> dict:
+        return await get_recognition_service().shazam.recognize(wav_bytes)
+
+
+class HttpBackend(RecognizerBackend):
+    name = "http"
+
+    def __init__(self, url: str, timeout: float = 15.0, retries: int = 0):
+        super().__init__(timeout=timeout, retries=retries)
+        if not url:
+            raise RecognizerError("http backend needs recognition.http_url")
+        self.url = url
+
+    async def _recognize(self, wav_bytes: bytes) -> dict:
+        client = get_recognition_service().http_client
+        return await client.request(
+            "POST",
+            self.url,
+            data=wav_bytes,
+            headers={"Content-Type": "audio/wav"},
+            raise_for_status=True,
+        )
+
+
+class ChainBackend(RecognizerBackend):
+    name = "chain"
+
+    def __init__(self, backends: list[RecognizerBackend]):
+        super().__init__()
+        self.backends = backends
+
+    async def recognize(self, wav_bytes: bytes) -> dict:
+        return await self._recognize(wav_bytes)
+
+    async def _recognize(self, wav_bytes: bytes) -> dict:
+        last: dict = {}
+        errors = []
+        for backend in self.backends:
+            try:
+                result = await backend.recognize(wav_bytes)
+            except RecognizerError as e:
+                errors.append(str(e))
+                continue
+
+            if result.get("track"):
+                return result
+            last = result
+
+        if errors and not last:
+            raise RecognizerError("; ".join(errors))
+        return last
+
+
+def create_backend(cfg: dict | None = None) -> RecognizerBackend:
+    cfg = cfg or read_config()
+    rec_cfg = cfg.get("recognition", {})
+    timeout = float(cfg.get("shazam", {}).get("timeout_seconds", 15))
+    retries = int(rec_cfg.get("retries", 0))
+
+    backends: list[RecognizerBackend] = []
+    for name in rec_cfg.get("backends") or ["shazam"]:
+        if name == "shazam":
+            backends.append(ShazamBackend(timeout=timeout, retries=retries))
+        elif name == "http":
+            backends.append(HttpBackend(rec_cfg.get("http_url", ""), timeout=timeout, retries=retries))
+        else:
+            raise RecognizerError(f"Unknown recognizer backend: {name}")
+
+    if len(backends) == 1:
+        return backends[0]
+    return ChainBackend(backends)
@@ -1,12 +1,16 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.environ.get("VINYLPI_DATA_DIR") or BASE_DIR / "data")
 
 CONFIG_PATH = DATA_DIR / "config.json"
 STATS_PATH = DATA_DIR / "stats.json"
 
 STATUS_PATH = DATA_DIR / "status.json"
+METRICS_PATH = DATA_DIR / "metrics.json"
+RECOGNITION_CACHE_PATH = DATA_DIR / "recognition_cache.json"
+COVER_CACHE_DIR = DATA_DIR / "covers"
 
 WEBAPP_DIR = BASE_DIR / "webapp"
 
@@ -9,6 +9,7 @@ from .routes.stats_api import stats_bp
 from .routes.uploads_api import uploads_bp
 from .routes.genius_api import genius_bp
 from .routes.ha_api import bp as ha_api_bp
+from .routes.metrics_api import metrics_bp
 
 def create_app() -> Flask:
     app = Flask(
@@ -26,4 +27,5 @@ def create_app() -> Flask:
     app.register_blueprint(uploads_bp)
     app.register_blueprint(genius_bp)
     app.register_blueprint(ha_api_bp)
+    app.register_blueprint(metrics_bp)
     return app
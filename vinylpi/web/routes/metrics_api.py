@@ -0,0 +1,14 @@
+import json
+from flask import Blueprint, jsonify
+from vinylpi.paths import METRICS_PATH
+
+metrics_bp = Blueprint("metrics_api", __name__)
+
+@metrics_bp.get("/api/metrics")
+def api_metrics():
+    if METRICS_PATH.exists():
+        try:
+            return jsonify(json.loads(METRICS_PATH.read_text(encoding="utf-8")))
+        except Exception:
+            pass
+    return jsonify({})